@@ -9,12 +9,17 @@ Cache modes:
         Long cache have a far greater expiration delay that is reset on access.
         This is useful to store data that will not change.
 """
-from gzip import open as open_archive
+from base64 import b32encode
+from collections import OrderedDict
+from functools import lru_cache
 from hashlib import blake2b
-from json import load, dump
-from os import listdir, utime, remove, makedirs, chmod
-from os.path import join, getmtime
+from json import loads, dumps
+from mmap import mmap, ACCESS_READ
+from os import scandir, utime, remove, makedirs, chmod, sep
+from os.path import getmtime
+from threading import Lock
 from time import time
+from zlib import compress, decompress, error as CompressionError
 from airfs._core.config import CACHE_DIR
 
 
@@ -28,10 +33,26 @@ CACHE_LONG_EXPIRY = 172800
 #: Short cache default expiry
 CACHE_SHORT_EXPIRY = 60
 
+#: Minimum delay between two resets of a long cache file expiry
+_LONG_CACHE_REFRESH_DELAY = 3600
+
+#: Cache content compression level (Favor speed over size)
+_COMPRESSION_LEVEL = 1
+
 #: To initialize cache directories only once
 _CACHE_INITIALIZED = False
 
+#: In memory cache of most recently used cache files: path: (timestamp, object)
+_MEMORY_CACHE = OrderedDict()  # type: OrderedDict
+
+#: In memory cache maximum size
+_MEMORY_CACHE_SIZE = 256
 
+#: In memory cache lock
+_MEMORY_CACHE_LOCK = Lock()
+
+
+@lru_cache(maxsize=4096)
 def _hash_name(name):
     """
     Convert name to hashed name.
@@ -42,38 +63,48 @@ def _hash_name(name):
     Returns:
         str: Hashed name.
     """
-    return blake2b(name.encode(), digest_size=32).hexdigest()
+    return b32encode(blake2b(name.encode(), digest_size=15).digest()).decode()
 
 
 def clear_cache():
     """
     Clear expired cache files.
     """
-    expiry = _get_expiry()
-    for cached_name in listdir(CACHE_DIR):
-        path = join(CACHE_DIR, cached_name)
-        if getmtime(path) < expiry[cached_name[-1]]:
-            remove(path)
-            continue
+    current_time = time()
+    short_expiry = current_time - CACHE_SHORT_EXPIRY
+    long_expiry = current_time - CACHE_LONG_EXPIRY
+    with scandir(CACHE_DIR) as entries:
+        for entry in entries:
+            if entry.stat().st_mtime < (
+                short_expiry if entry.name[-1] == "s" else long_expiry
+            ):
+                _remove(entry.path)
 
 
-def _get_expiry():
+def _remove(path):
     """
-    Get expiry timestamps.
+    Remove a cache file.
 
-    Returns:
-        dict: Expiry for both short and long modes.
+    Removal is done synchronously, because a deferred removal may delete a new
+    cache file written to the same path in the meantime.
+
+    Args:
+        path (str): Cache file path.
     """
-    current_time = time()
-    return {
-        "s": current_time - CACHE_SHORT_EXPIRY,
-        "l": current_time - CACHE_LONG_EXPIRY,
-    }
+    try:
+        remove(path)
+    except FileNotFoundError:
+        # Already removed by another thread or process
+        pass
 
 
 def get_cache(name):
     """
-    Get an object from disk cache.
+    Get an object from cache.
+
+    Most recently used objects are also kept in memory. They are still checked
+    against the disk cache file to handle expiry and updates by other processes.
+    A shallow copy of the object is returned.
 
     Args:
         name (str): Cache name.
@@ -81,27 +112,51 @@ def get_cache(name):
     Returns:
         dict or list or None: object, None if object is not cached.
     """
-    expiry = _get_expiry()
+    current_time = time()
     hashed_name = _hash_name(name)
 
-    for mode in ("s", "l"):
-        path = join(CACHE_DIR, hashed_name + mode)
+    for mode, expiry in (
+        ("s", current_time - CACHE_SHORT_EXPIRY),
+        ("l", current_time - CACHE_LONG_EXPIRY),
+    ):
+        path = f"{CACHE_DIR}{sep}{hashed_name}{mode}"
 
         try:
             timestamp = getmtime(path)
         except FileNotFoundError:
             continue
 
-        if timestamp < expiry[mode]:
-            remove(path)
+        if timestamp < expiry:
+            _remove(path)
             continue
 
-        if mode == "l":
+        with _MEMORY_CACHE_LOCK:
+            try:
+                cached_timestamp, obj = _MEMORY_CACHE[path]
+            except KeyError:
+                cached_timestamp = obj = None
+            else:
+                _MEMORY_CACHE.move_to_end(path)
+
+        if cached_timestamp != timestamp:
+            # Not in memory, or file updated since
+            try:
+                with open(path, "rb") as file:
+                    with mmap(file.fileno(), 0, access=ACCESS_READ) as data:
+                        content = decompress(data)
+            except (CompressionError, ValueError):
+                # Empty file or not a cache file in the current format
+                _remove(path)
+                continue
+            obj = loads(content)
+
+        if mode == "l" and timestamp < current_time - _LONG_CACHE_REFRESH_DELAY:
             # In long cache mode, reset expiry delay
-            utime(path)
+            utime(path, (current_time, current_time))
+            timestamp = getmtime(path)
 
-        with open_archive(path, "rt") as file:
-            return load(file)
+        _memory_cache_set(path, timestamp, obj)
+        return obj.copy()
 
     raise NoCacheException()
 
@@ -115,7 +170,7 @@ def set_cache(name, obj, long=False):
         obj (dict or list): Object to cache.
         long (bool): If true, enable "long cache".
     """
-    path = join(CACHE_DIR, _hash_name(name) + ("l" if long else "s"))
+    path = f"{CACHE_DIR}{sep}{_hash_name(name)}{'l' if long else 's'}"
 
     global _CACHE_INITIALIZED
     if not _CACHE_INITIALIZED:
@@ -123,5 +178,24 @@ def set_cache(name, obj, long=False):
         chmod(CACHE_DIR, 0o700)
         _CACHE_INITIALIZED = True
 
-    with open_archive(path, "wt") as file:
-        dump(obj, file)
+    with open(path, "wb") as file:
+        file.write(compress(dumps(obj).encode(), _COMPRESSION_LEVEL))
+
+    # Modification time is only final once the file is closed
+    _memory_cache_set(path, getmtime(path), obj.copy())
+
+
+def _memory_cache_set(path, timestamp, obj):
+    """
+    Add an object to the in memory cache.
+
+    Args:
+        path (str): Cache file path.
+        timestamp (float): Cache file modification time.
+        obj (dict or list): Object to cache.
+    """
+    with _MEMORY_CACHE_LOCK:
+        _MEMORY_CACHE[path] = (timestamp, obj)
+        _MEMORY_CACHE.move_to_end(path)
+        if len(_MEMORY_CACHE) > _MEMORY_CACHE_SIZE:
+            _MEMORY_CACHE.popitem(last=False)
@@ -3,6 +3,8 @@
 from contextlib import contextmanager
 from functools import wraps
 from os import fsdecode, fsencode
+from queue import Queue, Full
+from threading import Thread, Event
 
 from airfs._core.exceptions import handle_os_exceptions, ObjectNotImplementedError
 
@@ -153,6 +155,69 @@ class SeatsCounter:
         return self._seats == 0
 
 
+def prefetch(iterable, size=1000):
+    """
+    Iterate over an iterable while its next items are fetched in a background thread.
+
+    This allows to overlap the requests performed by the iterable with the
+    processing of items by the caller.
+
+    Args:
+        iterable (iterable): Iterable.
+        size (int): Maximum count of items fetched in advance.
+
+    Yields:
+        object: Items.
+    """
+    items = Queue(maxsize=size)
+    stop = Event()
+
+    def put(item):
+        """
+        Put an item in the queue, unless iteration was stopped by the caller.
+
+        Args:
+            item (tuple): Item.
+
+        Returns:
+            bool: False if iteration was stopped.
+        """
+        while not stop.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except Full:
+                continue
+        return False
+
+    def fetch():
+        """
+        Fetch items from the iterable.
+        """
+        try:
+            for item in iterable:
+                if not put((True, item)):
+                    return
+        except BaseException as exception:
+            put((False, exception))
+        else:
+            put((False, None))
+
+    thread = Thread(target=fetch, daemon=True)
+    thread.start()
+    try:
+        while True:
+            is_item, item = items.get()
+            if is_item:
+                yield item
+            elif item is None:
+                return
+            else:
+                raise item
+    finally:
+        stop.set()
+
+
 @contextmanager
 def ignore_exception(exception):
     """
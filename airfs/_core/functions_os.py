@@ -286,7 +286,7 @@ class DirEntry:
         Returns:
             dict: keyword arguments
         """
-        return self._system.get_client_kwargs(self._path)
+        return self._system._cached_client_kwargs(self._path)
 
     @property  # type: ignore
     @memoizedmethod
@@ -310,8 +310,10 @@ def splitdrive(path):
         tuple of str: drive, tail.
     """
     relative = get_instance(path).relpath(path)
-    drive = path.rsplit(relative, 1)[0]
-    if drive and not drive[-2:] == "//":
+    index = path.rfind(relative)
+    drive = path[:index] if index != -1 else path
+    if drive and not drive.endswith("//"):
         relative = "/" + relative
-        drive = drive.rstrip("/")
+        if drive[-1] == "/":
+            drive = drive[:-1]
     return drive, relative
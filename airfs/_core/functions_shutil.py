@@ -45,12 +45,12 @@ def _copy(src, dst, src_is_storage, dst_is_storage, follow_symlinks):
                     pass
 
             for caller, called, method in (
-                (system_dst, system_src, "copy_from_%s"),
-                (system_src, system_dst, "copy_to_%s"),
+                (system_dst, system_src, f"copy_from_{system_src.storage}"),
+                (system_src, system_dst, f"copy_to_{system_dst.storage}"),
             ):
-                if hasattr(caller, method % called.storage):
+                if hasattr(caller, method):
                     try:
-                        return getattr(caller, method % called.storage)(
+                        return getattr(caller, method)(
                             src, dst, called, follow_symlinks
                         )
                     except AirfsInternalException:
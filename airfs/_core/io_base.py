@@ -3,9 +3,12 @@ from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
 from io import IOBase, UnsupportedOperation
 from itertools import chain
-from os import fsdecode
+from os import cpu_count, fsdecode
 from threading import Lock
 
+#: Default maximum number of workers, like "ThreadPoolExecutor" on Python >= 3.8
+MAX_WORKERS = min(32, (cpu_count() or 1) + 4)
+
 
 class ObjectIOBase(IOBase):
     """
@@ -158,11 +161,11 @@ class WorkerPoolBase:
     Base class that handle a worker pool.
 
     Args:
-        max_workers (int): Maximum number of workers.
+        max_workers (int): Maximum number of workers. Default to "MAX_WORKERS".
     """
 
     def __init__(self, max_workers=None):
-        self._workers_count = max_workers
+        self._workers_count = max_workers or MAX_WORKERS
 
     @property  # type: ignore
     @memoizedmethod
@@ -137,6 +137,7 @@ class ObjectBufferedIOBase(BufferedIOBase, ObjectIOBase, WorkerPoolBase):
             if self._seek:
                 with handle_os_exceptions():
                     self._close_writable()
+            self._raw._system.clear_head_cache()
 
     def _close_writable(self):
         """
@@ -69,7 +69,7 @@ class ObjectRawIOBase(RawIOBase, ObjectIOBase):
                 storage_parameters=storage_parameters, **kwargs
             )
 
-        self._client_kwargs = self._system.get_client_kwargs(name)
+        self._client_kwargs = self._system._cached_client_kwargs(name)
 
         self._is_raw_of_buffered = False
 
@@ -140,6 +140,7 @@ class ObjectRawIOBase(RawIOBase, ObjectIOBase):
         if self._writable:
             with handle_os_exceptions():
                 self._flush(self._get_buffer())
+            self._system.clear_head_cache()
 
     @abstractmethod
     def _flush(self, buffer):
@@ -295,11 +296,7 @@ class ObjectRawIOBase(RawIOBase, ObjectIOBase):
             self._seek = end
 
         with handle_os_exceptions():
-            read_data = self._read_range(start, end)
-
-        read_size = len(read_data)
-        if read_size:
-            memoryview(b)[:read_size] = read_data
+            read_size = self._read_range_into(start, memoryview(b))
 
         if read_size != size:
             with self._seek_lock:
@@ -320,6 +317,26 @@ class ObjectRawIOBase(RawIOBase, ObjectIOBase):
             bytes: number of bytes read
         """
 
+    def _read_range_into(self, start, buffer):
+        """
+        Read a range of bytes in stream into a buffer.
+
+        The range end is defined by the buffer size. Storage that can write directly
+        in the buffer should override this method to avoid an intermediate copy.
+
+        Args:
+            start (int): Start stream position.
+            buffer (memoryview): Buffer.
+
+        Returns:
+            int: number of bytes read
+        """
+        read_data = self._read_range(start, start + len(buffer))
+        read_size = len(read_data)
+        if read_size:
+            buffer[:read_size] = read_data
+        return read_size
+
     def seek(self, offset, whence=SEEK_SET):
         """
         Change the stream position to the given byte offset.
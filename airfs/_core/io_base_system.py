@@ -1,9 +1,13 @@
 """Cloud storage abstract System"""
 from abc import abstractmethod, ABC
-from collections import OrderedDict, namedtuple
-from re import compile
+from collections import deque, namedtuple
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from itertools import islice
 from stat import S_IFDIR, S_IFREG, S_IFLNK
+from time import time
 from posixpath import join, normpath, dirname
+from re import compile, escape
 from dateutil.parser import parse
 
 from airfs._core.io_base import WorkerPoolBase
@@ -14,7 +18,52 @@ from airfs._core.exceptions import (
     ObjectNotImplementedError,
     ObjectUnsupportedOperation,
 )
-from airfs._core.functions_core import SeatsCounter
+from airfs._core.functions_core import SeatsCounter, prefetch as prefetch_items
+
+#: Missing value marker
+_MISSING = object()
+
+#: Flags of a string pattern compiled without flags
+_DEFAULT_FLAGS = compile("").flags
+
+
+class _StatKeyTable(dict):
+    """
+    "str.translate" table converting lower case header keys to stat fields names.
+
+    Keeps only "a-z", "0-9" and "_" characters and converts "-" to "_".
+    """
+
+    __slots__ = ()
+
+    def __init__(self):
+        dict.__init__(self, ((char, None) for char in range(256)))
+        for char in "abcdefghijklmnopqrstuvwxyz0123456789_":
+            self[ord(char)] = ord(char)
+        self[ord("-")] = ord("_")
+
+    def __missing__(self, key):
+        return None
+
+
+_STAT_KEY_TABLE = _StatKeyTable()
+
+
+@lru_cache(maxsize=128)
+def _stat_result_type(fields):
+    """
+    Get the stat result type for the specified fields.
+
+    Args:
+        fields (tuple of str): Fields names.
+
+    Returns:
+        type: namedtuple subclass.
+    """
+    stat_result = namedtuple("stat_result", fields)
+    stat_result.__name__ = "os.stat_result"
+    stat_result.__module__ = "airfs"
+    return stat_result
 
 
 class SystemBase(ABC, WorkerPoolBase):
@@ -28,7 +77,11 @@ class SystemBase(ABC, WorkerPoolBase):
 
     Args:
         storage_parameters (dict): Storage configuration parameters.
-            Generally, client configuration and credentials.
+            Generally, client configuration and credentials. The
+            "airfs.head_cache_ttl" key can be set to a duration in seconds to cache
+            objects headers for this duration. Changes not done with the "remove"
+            and "make_dir" methods or with this storage files objects may then be
+            seen only after this delay. Headers are not cached by default.
         unsecure (bool): If True, disables TLS/SSL to improves transfer performance.
             But makes connection unsecure.
         roots (tuple): Tuple of roots to force use.
@@ -41,6 +94,13 @@ class SystemBase(ABC, WorkerPoolBase):
         "_client",
         "_cache",
         "_roots",
+        "_relpaths",
+        "_roots_pattern",
+        "_string_roots",
+        "_pattern_roots",
+        "_head_cache",
+        "_head_cache_ttl",
+        "_client_kwargs_cache",
     )
 
     #: If True, storage support symlinks
@@ -51,17 +111,37 @@ class SystemBase(ABC, WorkerPoolBase):
     _CTIME_KEYS = ()
     _MTIME_KEYS = ("Last-Modified",)
 
-    _CHAR_FILTER = compile(r"[^a-z0-9_]*")
+    #: Header keys not added to "stat" results, because already converted
+    _STAT_EXCLUDED_KEYS = frozenset()  # type: ignore
+
+    #: Maximum count of cached relative paths
+    _RELPATHS_CACHE_SIZE = 1024
+
+    #: Maximum count of cached headers
+    _HEAD_CACHE_SIZE = 1024
+
+    #: If True, "get_client_kwargs" results can be cached and shared between calls.
+    #: Requires that the storage never modifies client arguments.
+    _CACHE_CLIENT_KWARGS = False
+
+    #: Maximum count of cached client arguments
+    _CLIENT_KWARGS_CACHE_SIZE = 1024
+
+    #: If True, sub directories are listed concurrently when results are not limited
+    _CONCURRENT_LISTING = True
 
     def __init__(self, storage_parameters=None, unsecure=False, roots=None, **_):
         WorkerPoolBase.__init__(self)
 
+        self._head_cache = {}
         if storage_parameters:
+            self._head_cache_ttl = storage_parameters.get("airfs.head_cache_ttl", 0)
             storage_parameters = storage_parameters.copy()
             for key in tuple(storage_parameters):
                 if key.startswith("airfs."):
                     del storage_parameters[key]
         else:
+            self._head_cache_ttl = 0
             storage_parameters = dict()
 
         self._storage_parameters = storage_parameters
@@ -71,11 +151,10 @@ class SystemBase(ABC, WorkerPoolBase):
         self._client = None
 
         self._cache = {}
+        self._relpaths = {}
+        self._client_kwargs_cache = {}
 
-        if roots:
-            self._roots = roots
-        else:
-            self._roots = self._get_roots()
+        self.roots = roots or self._get_roots()
 
     @property
     def storage(self):
@@ -183,6 +262,31 @@ class SystemBase(ABC, WorkerPoolBase):
             dict: client args
         """
 
+    def _cached_client_kwargs(self, path):
+        """
+        Get base keyword arguments for client for a specific path, from cache if
+        supported by the storage.
+
+        Args:
+            path (str): Absolute path or URL.
+
+        Returns:
+            dict: client args. Must not be modified.
+        """
+        if not self._CACHE_CLIENT_KWARGS:
+            return self.get_client_kwargs(path)
+
+        try:
+            return self._client_kwargs_cache[path]
+        except KeyError:
+            pass
+
+        client_kwargs = self.get_client_kwargs(path)
+        if len(self._client_kwargs_cache) >= self._CLIENT_KWARGS_CACHE_SIZE:
+            self._client_kwargs_cache.clear()
+        self._client_kwargs_cache[path] = client_kwargs
+        return client_kwargs
+
     def getctime(self, path=None, client_kwargs=None, header=None):
         """
         Return the creation time of path.
@@ -195,7 +299,9 @@ class SystemBase(ABC, WorkerPoolBase):
         Returns:
             float: The number of seconds since the epoch (see the time module).
         """
-        return self._getctime_from_header(self.head(path, client_kwargs, header))
+        if header is None:
+            header = self.head(path, client_kwargs)
+        return self._getctime_from_header(header)
 
     def _getctime_from_header(self, header):
         """
@@ -221,7 +327,9 @@ class SystemBase(ABC, WorkerPoolBase):
         Returns:
             float: The number of seconds since the epoch (see the time module).
         """
-        return self._getmtime_from_header(self.head(path, client_kwargs, header))
+        if header is None:
+            header = self.head(path, client_kwargs)
+        return self._getmtime_from_header(header)
 
     def _getmtime_from_header(self, header):
         """
@@ -249,10 +357,17 @@ class SystemBase(ABC, WorkerPoolBase):
             float: The number of seconds since the epoch
         """
         for key in keys:
-            try:
-                date_value = header[key]
-            except KeyError:
+            date_value = header.get(key, _MISSING)
+            if date_value is _MISSING:
                 continue
+            try:
+                # Fast path for HTTP dates
+                date = parsedate_to_datetime(date_value)
+            except (TypeError, ValueError, AttributeError, IndexError):
+                pass
+            else:
+                if date.tzinfo is not None:
+                    return date.timestamp()
             try:
                 return parse(date_value).timestamp()
             except TypeError:
@@ -280,7 +395,9 @@ class SystemBase(ABC, WorkerPoolBase):
         Returns:
             int: Size in bytes.
         """
-        return self._getsize_from_header(self.head(path, client_kwargs, header))
+        if header is None:
+            header = self.head(path, client_kwargs)
+        return self._getsize_from_header(header)
 
     def _getsize_from_header(self, header):
         """
@@ -293,12 +410,10 @@ class SystemBase(ABC, WorkerPoolBase):
             int: Size in bytes.
         """
         for key in self._SIZE_KEYS:
-            try:
-                return int(header[key])
-            except KeyError:
-                continue
-        else:
-            raise ObjectUnsupportedOperation("getsize")
+            size = header.get(key, _MISSING)
+            if size is not _MISSING:
+                return int(size)
+        raise ObjectUnsupportedOperation("getsize")
 
     def isdir(
         self,
@@ -419,9 +534,48 @@ class SystemBase(ABC, WorkerPoolBase):
         if header is not None:
             return header
         elif client_kwargs is None:
-            client_kwargs = self.get_client_kwargs(path)
+            client_kwargs = self._cached_client_kwargs(path)
+        if self._head_cache_ttl:
+            return self._cached_head(client_kwargs)
         return self._head(client_kwargs)
 
+    def _cached_head(self, client_kwargs):
+        """
+        Returns object HTTP header from the headers cache.
+
+        Args:
+            client_kwargs (dict): Client arguments.
+
+        Returns:
+            dict: HTTP header.
+        """
+        try:
+            key = frozenset(client_kwargs.items())
+        except TypeError:
+            # Not hashable client arguments
+            return self._head(client_kwargs)
+
+        current_time = time()
+        try:
+            expiry, header = self._head_cache[key]
+        except KeyError:
+            expiry = 0
+
+        if expiry < current_time:
+            header = self._head(client_kwargs)
+            if len(self._head_cache) >= self._HEAD_CACHE_SIZE:
+                self._head_cache.clear()
+            self._head_cache[key] = (current_time + self._head_cache_ttl, header)
+
+        # Header may be modified by the caller
+        return header.copy() if isinstance(header, dict) else header
+
+    def clear_head_cache(self):
+        """
+        Clear cached objects headers.
+        """
+        self._head_cache.clear()
+
     @property
     def roots(self):
         """
@@ -441,6 +595,39 @@ class SystemBase(ABC, WorkerPoolBase):
             roots (tuple of str): URL roots
         """
         self._roots = roots
+        self._roots_pattern = self._compile_roots(roots)
+        self._string_roots = tuple(
+            root for root in roots if not isinstance(root, Pattern)
+        )
+        self._pattern_roots = tuple(root for root in roots if isinstance(root, Pattern))
+        self._relpaths.clear()
+        self._client_kwargs_cache.clear()
+
+    @staticmethod
+    def _compile_roots(roots):
+        """
+        Compile roots in a single pattern that matches a path up to the end of the
+        first matching root.
+
+        String roots match anywhere in the path, patterns roots match at its start.
+
+        Args:
+            roots (tuple of str or re.Pattern): URL roots
+
+        Returns:
+            re.Pattern or None: Pattern, or None if roots cannot be combined.
+        """
+        alternatives = []
+        for root in roots:
+            if not isinstance(root, Pattern):
+                alternatives.append(f"(?s:.*?){escape(root)}")
+            elif root.groups or root.flags != _DEFAULT_FLAGS:
+                # Groups numbers and flags would not be kept once combined
+                return None
+            else:
+                alternatives.append(f"(?:{root.pattern})")
+
+        return compile("|".join(alternatives)) if alternatives else None
 
     def relpath(self, path):
         """
@@ -452,6 +639,32 @@ class SystemBase(ABC, WorkerPoolBase):
         Returns:
             str: relative path.
         """
+        try:
+            return self._relpaths[path]
+        except KeyError:
+            pass
+
+        relative = self._relpath(path)
+        if len(self._relpaths) >= self._RELPATHS_CACHE_SIZE:
+            self._relpaths.clear()
+        self._relpaths[path] = relative
+        return relative
+
+    def _relpath(self, path):
+        """
+        Get path relative to storage, without using cached results.
+
+        args:
+            path (str): Absolute path or URL.
+
+        Returns:
+            str: relative path.
+        """
+        roots_pattern = self._roots_pattern
+        if roots_pattern is not None:
+            match = roots_pattern.match(path)
+            return path[match.end() :].lstrip("/") if match else path
+
         for root in self.roots:
             if isinstance(root, Pattern):
                 match = root.match(path)
@@ -477,11 +690,10 @@ class SystemBase(ABC, WorkerPoolBase):
         Returns:
             bool: True if absolute path.
         """
-        for root in self.roots:
-            if isinstance(root, Pattern):
-                if root.match(path):
-                    return True
-            elif path.startswith(root):
+        if path.startswith(self._string_roots):
+            return True
+        for root in self._pattern_roots:
+            if root.match(path):
                 return True
         return False
 
@@ -500,7 +712,11 @@ class SystemBase(ABC, WorkerPoolBase):
         """
         if not relative:
             path = self.relpath(path)
-        return path and "/" not in path.rstrip("/")
+        index = path.find("/")
+        if index == -1:
+            return bool(path)
+        # Locators may only be followed by trailing slashes
+        return len(path.rstrip("/")) <= index
 
     def split_locator(self, path):
         """
@@ -513,12 +729,10 @@ class SystemBase(ABC, WorkerPoolBase):
             tuple of str: locator, path.
         """
         relative = self.relpath(path)
-        try:
-            locator, tail = relative.split("/", 1)
-        except ValueError:
-            locator = relative
-            tail = ""
-        return locator, tail
+        index = relative.find("/")
+        if index == -1:
+            return relative, ""
+        return relative[:index], relative[index + 1 :]
 
     def make_dir(self, path, relative=False):
         """
@@ -531,8 +745,9 @@ class SystemBase(ABC, WorkerPoolBase):
         if not relative:
             path = self.relpath(path)
         self._make_dir(
-            self.get_client_kwargs(self.ensure_dir_path(path, relative=True))
+            self._cached_client_kwargs(self.ensure_dir_path(path, relative=True))
         )
+        self._head_cache.clear()
 
     def _make_dir(self, client_kwargs):
         """
@@ -553,7 +768,8 @@ class SystemBase(ABC, WorkerPoolBase):
         """
         if not relative:
             path = self.relpath(path)
-        self._remove(self.get_client_kwargs(path))
+        self._remove(self._cached_client_kwargs(path))
+        self._head_cache.clear()
 
     def _remove(self, client_kwargs):
         """
@@ -564,6 +780,19 @@ class SystemBase(ABC, WorkerPoolBase):
         """
         raise ObjectUnsupportedOperation("remove")
 
+    def _remove_many(self, client_kwargs_list):
+        """
+        Remove several objects.
+
+        Objects are removed concurrently. Storage may override this method to use a
+        more efficient batch request.
+
+        args:
+            client_kwargs_list (list of dict): Client arguments of each object.
+        """
+        for _ in self._workers.map(self._remove, client_kwargs_list):
+            continue
+
     def ensure_dir_path(self, path, relative=False):
         """
         Ensure the path is a dir path.
@@ -591,7 +820,12 @@ class SystemBase(ABC, WorkerPoolBase):
         return path
 
     def list_objects(
-        self, path="", relative=False, first_level=False, max_results=None
+        self,
+        path="",
+        relative=False,
+        first_level=False,
+        max_results=None,
+        prefetch=False,
     ):
         """
         List objects.
@@ -604,6 +838,9 @@ class SystemBase(ABC, WorkerPoolBase):
             first_level (bool): It True, returns only first level objects.
                 Else, returns full tree.
             max_results (int): If specified, the maximum result count returned.
+            prefetch (bool): If True and "max_results" is not specified, fetch next
+                entries in a background thread while the caller process the current
+                ones. This is only worth it for large listings.
 
         Yields:
             tuple: object path str, object header dict
@@ -617,9 +854,12 @@ class SystemBase(ABC, WorkerPoolBase):
             generator = self._list_locators(max_results)
         else:
             generator = self._list_objects(
-                self.get_client_kwargs(path), path, max_results, first_level
+                self._cached_client_kwargs(path), path, max_results, first_level
             )
 
+        if prefetch and max_results is None:
+            generator = prefetch_items(generator)
+
         if first_level:
             generator = self._list_first_level_only(generator)
         else:
@@ -660,28 +900,98 @@ class SystemBase(ABC, WorkerPoolBase):
 
         if dirs:
             path = path.rstrip("/")
-            for sub_path in dirs:
-                if path:
-                    full_path = "/".join((path, sub_path))
-                else:
-                    full_path = sub_path
-
-                max_results = seats.seats_left
-                if max_results:
-                    # Add an extra seat to ensure the good count when yielding itself
-                    max_results += 1
-
-                for obj_path, header in self._list_all_levels(
-                    self._list_objects(
-                        self.get_client_kwargs(full_path),
-                        full_path,
-                        max_results,
-                        False,
-                    ),
-                    full_path,
-                    seats,
-                ):
-                    yield "/".join((sub_path.rstrip("/"), obj_path)), header
+            if path:
+                full_paths = ["/".join((path, sub_path)) for sub_path in dirs]
+            else:
+                full_paths = dirs
+
+            if self._CONCURRENT_LISTING and seats.seats_left is None:
+                listings = self._list_sub_dirs_concurrently(dirs, full_paths)
+            else:
+                listings = self._list_sub_dirs(dirs, full_paths, seats)
+
+            list_all_levels = self._list_all_levels
+            for sub_path, full_path, generator in listings:
+                prefix = sub_path.rstrip("/") + "/"
+                for obj_path, header in list_all_levels(generator, full_path, seats):
+                    yield prefix + obj_path, header
+
+    def _list_sub_dirs(self, sub_paths, full_paths, seats):
+        """
+        Lists sub directories one after the other.
+
+        Args:
+            sub_paths (list of str): Sub directories paths relative to the listed path.
+            full_paths (list of str): Sub directories paths.
+            seats (airfs._core.functions_core.SeatsCounter): Seats counter.
+
+        Yields:
+            tuple: sub path str, full path str, iterable of tuple (path str,
+                header dict, directory bool)
+        """
+        get_client_kwargs = self._cached_client_kwargs
+        list_objects = self._list_objects
+        for sub_path, full_path in zip(sub_paths, full_paths):
+            max_results = seats.seats_left
+            if max_results:
+                # Add an extra seat to ensure the good count when yielding itself
+                max_results += 1
+
+            yield sub_path, full_path, list_objects(
+                get_client_kwargs(full_path), full_path, max_results, False
+            )
+
+    def _list_sub_dirs_concurrently(self, sub_paths, full_paths):
+        """
+        Lists sub directories concurrently.
+
+        At most one sub directory per worker is listed at a time, and listings are
+        yielded in sub directories order.
+
+        Args:
+            sub_paths (list of str): Sub directories paths relative to the listed path.
+            full_paths (list of str): Sub directories paths.
+
+        Yields:
+            tuple: sub path str, full path str, list of tuple (path str, header dict,
+                directory bool)
+        """
+
+        def list_sub_dir(full_path):
+            """
+            Lists a sub directory.
+
+            Args:
+                full_path (str): Sub directory path.
+
+            Returns:
+                list of tuple: path str, header dict, directory bool
+            """
+            return list(
+                self._list_objects(
+                    self._cached_client_kwargs(full_path), full_path, None, False
+                )
+            )
+
+        submit = self._workers.submit
+        paths = zip(sub_paths, full_paths)
+        pending = deque()
+        try:
+            for next_paths in islice(paths, self._workers_count):
+                pending.append((next_paths, submit(list_sub_dir, next_paths[1])))
+
+            while pending:
+                (sub_path, full_path), future = pending.popleft()
+                listing = future.result()
+
+                # Keep the worker busy with the next sub directory
+                for next_paths in islice(paths, 1):
+                    pending.append((next_paths, submit(list_sub_dir, next_paths[1])))
+
+                yield sub_path, full_path, listing
+        finally:
+            for _, future in pending:
+                future.cancel()
 
     @staticmethod
     def _list_first_level_only(generator):
@@ -835,25 +1145,24 @@ class SystemBase(ABC, WorkerPoolBase):
         path, client_kwargs, header = self.resolve(
             path, client_kwargs, header, follow_symlinks
         )
-        stat = OrderedDict(
-            (
-                ("st_mode", self._getmode(path, client_kwargs, header)),
-                ("st_ino", 0),
-                ("st_dev", 0),
-                ("st_nlink", 0),
-                ("st_uid", self._getuid()),
-                ("st_gid", self._getgid()),
-                ("st_size", 0),
-                ("st_atime", 0),
-                ("st_mtime", 0),
-                ("st_ctime", 0),
-                ("st_atime_ns", 0),
-                ("st_mtime_ns", 0),
-                ("st_ctime_ns", 0),
-            )
-        )
-
-        header = self.head(path, client_kwargs, header)
+        stat = {
+            "st_mode": self._getmode(path, client_kwargs, header),
+            "st_ino": 0,
+            "st_dev": 0,
+            "st_nlink": 0,
+            "st_uid": self._getuid(),
+            "st_gid": self._getgid(),
+            "st_size": 0,
+            "st_atime": 0,
+            "st_mtime": 0,
+            "st_ctime": 0,
+            "st_atime_ns": 0,
+            "st_mtime_ns": 0,
+            "st_ctime_ns": 0,
+        }
+
+        if header is None:
+            header = self.head(path, client_kwargs)
         try:
             stat["st_size"] = int(self._getsize_from_header(header))
         except ObjectUnsupportedOperation:
@@ -877,14 +1186,12 @@ class SystemBase(ABC, WorkerPoolBase):
         else:
             stat["st_mode"] += S_IFREG
 
-        sub = self._CHAR_FILTER.sub
-        for key, value in tuple(header.items()):
-            stat[sub("", key.lower().replace("-", "_"))] = value
+        excluded_keys = self._STAT_EXCLUDED_KEYS
+        for key, value in header.items():
+            if key not in excluded_keys:
+                stat[key.lower().translate(_STAT_KEY_TABLE)] = value
 
-        stat_result = namedtuple("stat_result", tuple(stat))
-        stat_result.__name__ = "os.stat_result"
-        stat_result.__module__ = "airfs"
-        return stat_result(**stat)
+        return _stat_result_type(tuple(stat))._make(stat.values())
 
     def read_link(self, path=None, client_kwargs=None, header=None):
         """
@@ -984,7 +1291,7 @@ class SystemBase(ABC, WorkerPoolBase):
             str: Shareable URL.
         """
         return self._shareable_url(
-            self.get_client_kwargs(self.relpath(path)), expires_in
+            self._cached_client_kwargs(self.relpath(path)), expires_in
         )
 
     def _shareable_url(self, client_kwargs, expires_in):
@@ -7,6 +7,8 @@ from io import BytesIO as _BytesIO
 from threading import Lock as _Lock
 
 from azure.common import AzureHttpError as _AzureHttpError  # type: ignore
+from requests import Session as _Session
+from requests.adapters import HTTPAdapter as _HTTPAdapter
 
 from airfs._core.io_base import WorkerPoolBase as _WorkerPoolBase
 from airfs._core.exceptions import (
@@ -22,6 +24,8 @@ from airfs.io import (
 
 MOUNT_REDIRECT = ("azure_blob", "azure_file")
 
+_MISSING = object()
+
 _ERROR_CODES = {403: _ObjectPermissionError, 404: _ObjectNotFoundError}
 
 
@@ -103,8 +107,11 @@ class _AzureBaseSystem(_SystemBase):
 
     __slots__ = ("_endpoint", "_endpoint_domain")
 
+    _CACHE_CLIENT_KWARGS = True
+
     _MTIME_KEYS = ("last_modified",)
     _SIZE_KEYS = ("content_length",)
+    _STAT_EXCLUDED_KEYS = frozenset(_MTIME_KEYS)
 
     def __init__(self, *args, **kwargs):
         self._endpoint = None
@@ -125,10 +132,9 @@ class _AzureBaseSystem(_SystemBase):
             float: The number of seconds since the epoch
         """
         for key in keys:
-            try:
-                return header.pop(key).timestamp()
-            except KeyError:
-                continue
+            value = header.get(key, _MISSING)
+            if value is not _MISSING:
+                return value.timestamp()
 
         raise _ObjectUnsupportedOperation(name)
 
@@ -163,17 +169,26 @@ class _AzureBaseSystem(_SystemBase):
 
     def _secured_storage_parameters(self):
         """
-        Updates storage parameters with unsecure mode.
+        Updates storage parameters with unsecure mode and HTTP session.
 
         Returns:
             dict: Updated storage_parameters.
         """
-        parameters = self._storage_parameters or dict()
+        parameters = (self._storage_parameters or dict()).copy()
 
         if self._unsecure:
-            parameters = parameters.copy()
             parameters["protocol"] = "http"
 
+        if "request_session" not in parameters:
+            # Share a session with a connection pool large enough for all workers
+            session = _Session()
+            adapter = _HTTPAdapter(
+                pool_connections=self._workers_count, pool_maxsize=self._workers_count
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            parameters["request_session"] = session
+
         return parameters
 
     def _format_src_url(self, path, caller_system):
@@ -212,9 +227,8 @@ class _AzureBaseSystem(_SystemBase):
         Returns:
             dict: Updated client_kwargs
         """
-        client_kwargs = client_kwargs.copy()
         if max_results:
-            client_kwargs["num_results"] = max_results
+            return {**client_kwargs, "num_results": max_results}
         return client_kwargs
 
     @staticmethod
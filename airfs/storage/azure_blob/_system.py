@@ -44,6 +44,7 @@ class _AzureBlobSystem(_AzureBaseSystem):
                 copy_source=(other_system or self)._format_src_url(src, self),
                 **self.get_client_kwargs(dst),
             )
+        self._head_cache.clear()
 
     def _get_client(self):
         """
@@ -52,7 +53,7 @@ class _AzureBlobSystem(_AzureBaseSystem):
         Returns:
             dict of azure.storage.blob.baseblobservice.BaseBlobService subclass: Service
         """
-        parameters = self._secured_storage_parameters().copy()
+        parameters = self._secured_storage_parameters()
 
         try:
             del parameters["blob_type"]
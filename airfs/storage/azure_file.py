@@ -50,6 +50,7 @@ class _AzureFileSystem(_AzureBaseSystem, _SystemBase):
                 copy_source=(other_system or self)._format_src_url(src, self),
                 **self.get_client_kwargs(dst),
             )
+        self._head_cache.clear()
 
     copy_from_azure_blobs = copy
 
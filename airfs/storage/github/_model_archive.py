@@ -28,7 +28,7 @@ class Archive(GithubObject):
         cls._raise_if_not_dir(not spec.get("archive"), spec, client)
 
         for parent in (Tag, Branch):
-            response = client.get(parent.LIST.format(**spec))[0]
+            response = client.get(parent.LIST.format_map(spec))[0]
             key = parent.LIST_KEY
             parent_key = parent.KEY
             for ref in response:
@@ -51,7 +51,7 @@ class Archive(GithubObject):
         Returns:
             dict: Object headers.
         """
-        url = cls.GET.format(**spec)
+        url = cls.GET.format_map(spec)
         headers = ""
         # Sometime, Content-Length is missing from response, so retry until success
         while "Content-Length" not in headers:
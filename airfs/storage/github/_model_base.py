@@ -65,14 +65,29 @@ class GithubObject(Mapping):
     #: Symlink like object pointing to the specified absolute path
     SYMLINK = None
 
+    #: Header keys, computed from "HEAD_KEYS", "HEAD_EXTRA" and "HEAD_FROM"
+    _KEYS = ()
+
+    #: "HEAD_KEYS" as tuple
+    _HEAD_KEYS = ()
+
     __slots__ = ("_client", "_spec", "_headers", "_header_updated")
 
+    def __init_subclass__(cls, **kwargs):
+        """
+        Compute subclass values derived from its class attributes.
+        """
+        super().__init_subclass__(**kwargs)
+        cls._HEAD_KEYS = tuple(cls.HEAD_KEYS)
+        cls._KEYS = tuple(
+            chain(cls.HEAD_KEYS, (key for key, _ in cls.HEAD_EXTRA), cls.HEAD_FROM)
+        )
+
     def __init__(self, client, spec, headers=None, name=None):
         self._client = client
 
         if name is not None:
-            spec = spec.copy()
-            spec[self.KEY] = name
+            spec = {**spec, self.KEY: name}
         self._spec = spec
 
         if headers is None:
@@ -112,13 +127,10 @@ class GithubObject(Mapping):
         """
         Iterate over object header keys.
 
-        Yields:
-            str: keys
+        Returns:
+            iterator of str: keys
         """
-        for key in chain(
-            self.HEAD_KEYS, (key for key, _ in self.HEAD_EXTRA), self.HEAD_FROM
-        ):
-            yield key
+        return iter(self._KEYS)
 
     def __len__(self):
         """
@@ -127,7 +139,7 @@ class GithubObject(Mapping):
         Returns:
             int: Length
         """
-        return len(self.HEAD_KEYS) + len(self.HEAD_EXTRA) + len(self.HEAD_FROM)
+        return len(self._KEYS)
 
     def __repr__(self):
         """
@@ -137,10 +149,12 @@ class GithubObject(Mapping):
         Returns:
             str: repr value.
         """
-        content = self._headers.copy()
-        for key in self:
-            content.setdefault(key, "<Not evaluated yet>")
-        return repr(content)
+        headers = self._headers
+        content = chain(
+            headers.items(),
+            ((key, "<Not evaluated yet>") for key in self if key not in headers),
+        )
+        return "{" + ", ".join(f"{key!r}: {value!r}" for key, value in content) + "}"
 
     __str__ = __repr__
 
@@ -315,7 +329,7 @@ class GithubObject(Mapping):
         Yields:
             tuple: object name str, object header dict, has content bool
         """
-        response = client.get_paged(cls.LIST.format(**spec))
+        response = client.get_paged(cls.LIST.format_map(spec))
 
         key = cls.LIST_KEY
         set_header = cls.set_header
@@ -338,7 +352,7 @@ class GithubObject(Mapping):
         Returns:
             dict: Object headers.
         """
-        return cls.set_header(client.get(cls.HEAD.format(**spec))[0])
+        return cls.set_header(client.get(cls.HEAD.format_map(spec))[0])
 
     @classmethod
     def head(cls, client, spec, headers=None):
@@ -373,7 +387,7 @@ class GithubObject(Mapping):
         """
         if cls.GET is None:
             raise ObjectIsADirectoryError(spec["full_path"])
-        return cls.GET.format(**spec)
+        return cls.GET.format_map(spec)
 
     @classmethod
     def set_header(cls, response):
@@ -386,7 +400,7 @@ class GithubObject(Mapping):
         Returns:
             dict: Object header.
         """
-        head = {key: response[key] for key in (response.keys() & cls.HEAD_KEYS)}
+        head = {key: response[key] for key in cls._HEAD_KEYS if key in response}
 
         for key_name, key_path in cls.HEAD_EXTRA:
             value = response
@@ -414,7 +428,7 @@ class GithubObject(Mapping):
         if cls.SYMLINK is None:
             raise ObjectNotASymlinkError(path=spec["full_path"])
 
-        target = cls.SYMLINK.format(**ChainMap(spec, cls.head(client, spec)))
+        target = cls.SYMLINK.format_map(ChainMap(spec, cls.head(client, spec)))
         content = spec.get("content")
         if isinstance(cls.STRUCT, dict) and not isinstance(content, dict):
             for key, obj_cls in cls.STRUCT.items():
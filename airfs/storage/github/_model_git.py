@@ -63,7 +63,7 @@ class Tree(GithubObject):
             sha = parent.head(self._client, spec)["sha"]
 
             response = self._client.get(
-                Commit.LIST.format(**spec), params=dict(path=spec["path"], sha=sha)
+                Commit.LIST.format_map(spec), params=dict(path=spec["path"], sha=sha)
             )[0]
             commit_header = Commit.set_header(response[0])
             for from_key in self.HEAD_FROM:
@@ -111,7 +111,7 @@ class Tree(GithubObject):
         """
         if cls.head(client, spec)["mode"] != "120000":
             raise ObjectNotASymlinkError(path=spec["full_path"])
-        response = client.session.request("GET", cls.GET.format(**spec))
+        response = client.session.request("GET", cls.GET.format_map(spec))
         _handle_http_errors(response)
         return response.text
 
@@ -159,7 +159,7 @@ class Tree(GithubObject):
             cwd_index += 1
 
         response = client.get(
-            cls.LIST.format(**spec),
+            cls.LIST.format_map(spec),
             never_expire=True,
             params=dict(recursive=cwd or not first_level),
         )[0]
@@ -242,7 +242,9 @@ class Commit(GithubObject):
         Returns:
             dict: Object headers.
         """
-        return cls.set_header(client.get(cls.HEAD.format(**spec), never_expire=True)[0])
+        return cls.set_header(
+            client.get(cls.HEAD.format_map(spec), never_expire=True)[0]
+        )
 
 
 class Tag(GithubObject):
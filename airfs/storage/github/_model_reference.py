@@ -35,7 +35,7 @@ class Reference(GithubObject):
             obj_spec = spec.copy()
             obj_spec[obj_cls.KEY] = ref
             try:
-                client.get(obj_cls.HEAD.format(**obj_spec))
+                client.get(obj_cls.HEAD.format_map(obj_spec))
             except ObjectNotFoundError:
                 continue
             return obj_cls
@@ -77,7 +77,7 @@ class DefaultBranch(GithubObject):
         """
         if "branch" not in spec:
             spec["ref"] = spec["branch"] = client.get(
-                "/repos/{owner}/{repo}".format(**spec)
+                "/repos/{owner}/{repo}".format_map(spec)
             )[0]["default_branch"]
 
     @classmethod
@@ -65,7 +65,7 @@ class ReleaseAsset(GithubObject):
         """
         if "tag" not in spec:
             spec["tag"] = cls._parent_release(client, spec)["tag_name"]
-        return cls.GET.format(**spec)
+        return cls.GET.format_map(spec)
 
     @classmethod
     def _parent_release(cls, client, spec):
@@ -79,7 +79,7 @@ class ReleaseAsset(GithubObject):
         Returns:
             dict: Release raw headers.
         """
-        return client.get(Release.HEAD.format(**spec))[0]
+        return client.get(Release.HEAD.format_map(spec))[0]
 
 
 class ReleaseArchive(Archive):
@@ -183,7 +183,7 @@ class LatestRelease(Release):
         Returns:
             str: Tag.
         """
-        return client.get(cls.HEAD.format(**spec))[0]["tag_name"]
+        return client.get(cls.HEAD.format_map(spec))[0]["tag_name"]
 
 
 class ReleaseDownload(GithubObject):
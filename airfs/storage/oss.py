@@ -56,6 +56,8 @@ class _OSSSystem(_SystemBase):
 
     __slots__ = ("_unsecure", "_endpoint")
 
+    _CACHE_CLIENT_KWARGS = True
+
     SUPPORTS_SYMLINKS = True
 
     _CTIME_KEYS = ("Creation-Date", "creation_date")
@@ -83,8 +85,8 @@ class _OSSSystem(_SystemBase):
             dst (str): Path or URL.
             other_system (airfs._core.io_system.SystemBase subclass): Unused.
         """
-        copy_source = self.get_client_kwargs(src)
-        copy_destination = self.get_client_kwargs(dst)
+        copy_source = self._cached_client_kwargs(src)
+        copy_destination = self._cached_client_kwargs(dst)
         with _handle_oss_error():
             bucket = self._get_bucket(copy_destination)
             bucket.copy_object(
@@ -92,6 +94,7 @@ class _OSSSystem(_SystemBase):
                 source_key=copy_source["key"],
                 target_key=copy_destination["key"],
             )
+        self._head_cache.clear()
 
     def get_client_kwargs(self, path):
         """
@@ -297,7 +300,7 @@ class _OSSSystem(_SystemBase):
                 yield obj.key[index:], self._model_to_dict(obj, ("key",)), False
 
             if response.next_marker:
-                client_kwargs["marker"] = response.next_marker
+                kwargs["marker"] = response.next_marker
             else:
                 break
 
@@ -350,7 +353,8 @@ class _OSSSystem(_SystemBase):
             )
 
         with _handle_oss_error():
-            return self._get_bucket(client_kwargs).put_symlink(target_key, symlink_key)
+            self._get_bucket(client_kwargs).put_symlink(target_key, symlink_key)
+        self._head_cache.clear()
 
 
 class OSSRawIO(_ObjectRawIOBase):
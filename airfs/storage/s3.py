@@ -1,11 +1,20 @@
 """Amazon Web Services S3"""
+from concurrent.futures import as_completed as _as_completed, wait as _wait
 from contextlib import contextmanager as _contextmanager
+from functools import lru_cache as _lru_cache, partial as _partial
+from operator import itemgetter as _itemgetter
+from threading import Lock as _Lock
 from io import UnsupportedOperation as _UnsupportedOperation
 import re as _re
 
 import boto3 as _boto3  # type: ignore
-from botocore.exceptions import ClientError as _ClientError  # type: ignore
+from botocore.config import Config as _Config  # type: ignore
+from botocore.exceptions import (  # type: ignore
+    ClientError as _ClientError,
+    IncompleteReadError as _IncompleteReadError,
+)
 
+from airfs._core.io_base import memoizedmethod as _memoizedmethod
 from airfs._core.exceptions import (
     ObjectNotFoundError as _ObjectNotFoundError,
     ObjectPermissionError as _ObjectPermissionError,
@@ -17,6 +26,65 @@ from airfs.io import (
     SystemBase as _SystemBase,
 )
 
+_MISSING = object()
+
+
+@_lru_cache(maxsize=8)
+def _default_config(pool_size):
+    """
+    Get the default client configuration.
+
+    Connections pool allows workers to run requests concurrently without waiting for
+    a connection. TCP keepalive avoid closing idle connections and retries with
+    backoff handle throttling.
+
+    Args:
+        pool_size (int): HTTP connections pool size, the workers count.
+
+    Returns:
+        botocore.config.Config: Configuration.
+    """
+    try:
+        return _Config(
+            max_pool_connections=pool_size,
+            tcp_keepalive=True,
+            retries=dict(mode="standard", max_attempts=5),
+        )
+    except TypeError:
+        # Options not supported by this botocore version
+        return _Config(max_pool_connections=pool_size)
+
+
+#: Session shared by systems without specific session parameters
+_DEFAULT_SESSION = None
+
+#: Lock for the default session creation and its use to create clients, because
+#: sessions are not thread-safe
+_SESSION_LOCK = _Lock()
+
+#: Response keys that are not part of objects headers
+_HEADER_EXCLUDED_KEYS = frozenset(("AcceptRanges", "ResponseMetadata"))
+
+#: "get_object" response keys that are not part of objects headers
+_GET_HEADER_EXCLUDED_KEYS = _HEADER_EXCLUDED_KEYS | {"Body", "ContentRange"}
+
+#: Maximum parts count of a multipart upload
+_MAX_PARTS = 10000
+
+#: Maximum objects count of a "delete_objects" request
+_MAX_DELETE_OBJECTS = 1000
+
+#: Source object header keys to keep when copying with a multipart upload
+_COPY_HEADER_KEYS = (
+    "CacheControl",
+    "ContentDisposition",
+    "ContentEncoding",
+    "ContentLanguage",
+    "ContentType",
+    "Expires",
+    "Metadata",
+)
+
 _ERROR_CODES = {
     "AccessDenied": _ObjectPermissionError,
     "NoSuchKey": _ObjectNotFoundError,
@@ -45,6 +113,89 @@ def _handle_client_error():
         raise
 
 
+# "(?!.*&X-Amz-Signature=)" allow ignoring presigned URLs to open them as regular
+# HTTP files
+
+#: Virtual-hosted–style URL root
+#: - http://<bucket>.s3.amazonaws.com/<key>
+#: - https://<bucket>.s3.amazonaws.com/<key>
+_HOST_ROOT = _re.compile(
+    r"^https?://[\w.-]+\.s3\.amazonaws\.com(?!.*&X-Amz-Signature=)"
+)
+
+#: Path-hosted–style URL root
+#: - http://s3.amazonaws.com/<bucket>/<key>
+#: - https://s3.amazonaws.com/<bucket>/<key>
+_PATH_ROOT = _re.compile(r"^https?://s3\.amazonaws\.com(?!.*&X-Amz-Signature=)")
+
+#: Transfer acceleration URL roots
+#: - http://<bucket>.s3-accelerate.amazonaws.com
+#: - https://<bucket>.s3-accelerate.amazonaws.com
+#: - http://<bucket>.s3-accelerate.dualstack.amazonaws.com
+#: - https://<bucket>.s3-accelerate.dualstack.amazonaws.com
+_ACCELERATE_ROOT = _re.compile(
+    r"^https?://[\w.-]+\.s3-accelerate\.amazonaws\.com(?!.*&X-Amz-Signature=)"
+)
+_ACCELERATE_DUALSTACK_ROOT = _re.compile(
+    r"^https?://[\w.-]+\.s3-accelerate\.dualstack\.amazonaws\.com"
+    r"(?!.*&X-Amz-Signature=)"
+)
+
+
+@_lru_cache(maxsize=32)
+def _region_roots(region):
+    """
+    Get URL roots specific to a region.
+
+    Args:
+        region (str): Region name or pattern.
+
+    Returns:
+        tuple of re.Pattern: Virtual-hosted–style URL root
+            (http(s)://<bucket>.s3-<region>.amazonaws.com/<key>) and path-hosted–style
+            URL root (http(s)://s3-<region>.amazonaws.com/<bucket>/<key>).
+    """
+    return (
+        _re.compile(
+            r"^https?://[\w.-]+\.s3-%s\.amazonaws\.com(?!.*&X-Amz-Signature=)" % region
+        ),
+        _re.compile(r"^https?://s3-%s\.amazonaws\.com(?!.*&X-Amz-Signature=)" % region),
+    )
+
+
+def _default_session():
+    """
+    Get the session shared by systems without specific session parameters.
+
+    Creating a session loads configuration and services models, this is done once.
+
+    Returns:
+        boto3.session.Session: session
+    """
+    global _DEFAULT_SESSION
+    with _SESSION_LOCK:
+        if _DEFAULT_SESSION is None:
+            _DEFAULT_SESSION = _boto3.session.Session()
+        return _DEFAULT_SESSION
+
+
+def _request_body(buffer):
+    """
+    Get the content of a buffer as request body.
+
+    Args:
+        buffer (memoryview): Buffer.
+
+    Returns:
+        bytes-like object: The buffer underlying object if the buffer covers it
+            entirely, else a copy of the buffer content.
+    """
+    obj = buffer.obj
+    if isinstance(obj, (bytes, bytearray)) and buffer.nbytes == len(obj):
+        return obj
+    return buffer.tobytes()
+
+
 class _S3System(_SystemBase):
     """
     S3 system.
@@ -62,9 +213,15 @@ class _S3System(_SystemBase):
 
     __slots__ = ("_session",)
 
+    _CACHE_CLIENT_KWARGS = True
+
     _SIZE_KEYS = ("ContentLength",)
     _CTIME_KEYS = ("CreationDate",)
     _MTIME_KEYS = ("LastModified",)
+    _STAT_EXCLUDED_KEYS = frozenset(_SIZE_KEYS + _CTIME_KEYS + _MTIME_KEYS)
+
+    #: Minimal part size in bytes of multipart copies
+    MULTIPART_COPY_PART_SIZE = 8388608
 
     def __init__(self, *args, **kwargs):
         self._session = None
@@ -79,10 +236,79 @@ class _S3System(_SystemBase):
             dst (str): Path or URL.
             other_system (airfs._core.io_system.SystemBase subclass): Unused.
         """
-        copy_source = self.get_client_kwargs(src)
-        copy_destination = self.get_client_kwargs(dst)
+        copy_source = self._cached_client_kwargs(src)
+        copy_destination = self._cached_client_kwargs(dst)
+        try:
+            with _handle_client_error():
+                self.client.copy_object(CopySource=copy_source, **copy_destination)
+
+        except _ClientError as exception:
+            # Objects too big for "copy_object" are copied using a multipart upload
+            error = exception.response["Error"]
+            if error["Code"] != "InvalidRequest" or (
+                "maximum allowable size" not in error.get("Message", "")
+            ):
+                raise
+            self._copy_multipart(
+                copy_source, copy_destination, self.head(client_kwargs=copy_source)
+            )
+        self._head_cache.clear()
+
+    def _copy_multipart(self, copy_source, copy_destination, header):
+        """
+        Copy object using a multipart upload with parts copied in parallel.
+
+        Args:
+            copy_source (dict): Source client arguments.
+            copy_destination (dict): Destination client arguments.
+            header (dict): Source object header.
+        """
+        size = header["ContentLength"]
+        part_size = max(self.MULTIPART_COPY_PART_SIZE, -(-size // _MAX_PARTS))
+        client = self.client
+
         with _handle_client_error():
-            self.client.copy_object(CopySource=copy_source, **copy_destination)
+            upload_id = client.create_multipart_upload(
+                **{key: header[key] for key in _COPY_HEADER_KEYS if key in header},
+                **copy_destination,
+            )["UploadId"]
+
+        submit = self._workers.submit
+        upload_part_copy = client.upload_part_copy
+        futures = dict()
+        try:
+            for part_number, start in enumerate(range(0, size, part_size), 1):
+                futures[part_number] = submit(
+                    upload_part_copy,
+                    CopySource=copy_source,
+                    CopySourceRange=f"bytes={start}-{min(start + part_size, size) - 1}",
+                    PartNumber=part_number,
+                    UploadId=upload_id,
+                    **copy_destination,
+                )
+
+            with _handle_client_error():
+                parts = [
+                    dict(
+                        ETag=future.result()["CopyPartResult"]["ETag"],
+                        PartNumber=part_number,
+                    )
+                    for part_number, future in futures.items()
+                ]
+                client.complete_multipart_upload(
+                    MultipartUpload={"Parts": parts},
+                    UploadId=upload_id,
+                    **copy_destination,
+                )
+
+        except BaseException:
+            # Parts still copying after the abort would be kept and billed
+            for future in futures.values():
+                future.cancel()
+            _wait(futures.values())
+            with _handle_client_error():
+                client.abort_multipart_upload(UploadId=upload_id, **copy_destination)
+            raise
 
     def get_client_kwargs(self, path):
         """
@@ -108,9 +334,11 @@ class _S3System(_SystemBase):
             boto3.session.Session: session
         """
         if self._session is None:
-            self._session = _boto3.session.Session(
-                **self._storage_parameters.get("session", dict())
-            )
+            session_kwargs = self._storage_parameters.get("session")
+            if session_kwargs:
+                self._session = _boto3.session.Session(**session_kwargs)
+            else:
+                self._session = _default_session()
         return self._session
 
     def _get_client(self):
@@ -120,13 +348,21 @@ class _S3System(_SystemBase):
         Returns:
             boto3.session.Session.client: client
         """
-        client_kwargs = self._storage_parameters.get("client", dict())
+        client_kwargs = self._storage_parameters.get("client", dict()).copy()
 
         if self._unsecure:
-            client_kwargs = client_kwargs.copy()
             client_kwargs["use_ssl"] = False
 
-        return self._get_session().client("s3", **client_kwargs)
+        # A user defined configuration has priority over the default one
+        config = _default_config(self._workers_count)
+        user_config = client_kwargs.get("config")
+        client_kwargs["config"] = (
+            config if user_config is None else config.merge(user_config)
+        )
+
+        session = self._get_session()
+        with _SESSION_LOCK:
+            return session.client("s3", **client_kwargs)
 
     def _get_roots(self):
         """
@@ -151,45 +387,19 @@ class _S3System(_SystemBase):
             pass
 
         # Use default AWS roots
-        region = self._get_session().region_name or r"[\w-]+"
+        host_region_root, path_region_root = _region_roots(
+            self._get_session().region_name or r"[\w-]+"
+        )
         return (
             # S3 scheme
             # - s3://<bucket>/<key>
             "s3://",
-            # Virtual-hosted–style URL
-            # - http://<bucket>.s3.amazonaws.com/<key>
-            # - https://<bucket>.s3.amazonaws.com/<key>
-            # - http://<bucket>.s3-<region>.amazonaws.com/<key>
-            # - https://<bucket>.s3-<region>.amazonaws.com/<key>
-            _re.compile(
-                r"^https?://[\w.-]+\.s3\.amazonaws\.com(?!.*&X-Amz-Signature=)"
-            ),
-            _re.compile(
-                r"^https?://[\w.-]+\.s3-%s\.amazonaws\.com(?!.*&X-Amz-Signature=)"
-                % region
-            ),
-            # Path-hosted–style URL
-            # - http://s3.amazonaws.com/<bucket>/<key>
-            # - https://s3.amazonaws.com/<bucket>/<key>
-            # - http://s3-<region>.amazonaws.com/<bucket>/<key>
-            # - https://s3-<region>.amazonaws.com/<bucket>/<key>
-            _re.compile(r"^https?://s3\.amazonaws\.com(?!.*&X-Amz-Signature=)"),
-            _re.compile(
-                r"^https?://s3-%s\.amazonaws\.com(?!.*&X-Amz-Signature=)" % region
-            ),
-            # Transfer acceleration URL
-            # - http://<bucket>.s3-accelerate.amazonaws.com
-            # - https://<bucket>.s3-accelerate.amazonaws.com
-            # - http://<bucket>.s3-accelerate.dualstack.amazonaws.com
-            # - https://<bucket>.s3-accelerate.dualstack.amazonaws.com
-            _re.compile(
-                r"^https?://[\w.-]+\.s3-accelerate\.amazonaws\.com"
-                r"(?!.*&X-Amz-Signature=)"
-            ),
-            _re.compile(
-                r"^https?://[\w.-]+\.s3-accelerate\.dualstack\.amazonaws\.com"
-                r"(?!.*&X-Amz-Signature=)"
-            ),
+            _HOST_ROOT,
+            host_region_root,
+            _PATH_ROOT,
+            path_region_root,
+            _ACCELERATE_ROOT,
+            _ACCELERATE_DUALSTACK_ROOT,
         )
 
     @staticmethod
@@ -206,10 +416,9 @@ class _S3System(_SystemBase):
             float: The number of seconds since the epoch
         """
         for key in keys:
-            try:
-                return header.pop(key).timestamp()
-            except KeyError:
-                continue
+            value = header.get(key, _MISSING)
+            if value is not _MISSING:
+                return value.timestamp()
         raise _UnsupportedOperation(name)
 
     def _getsize_from_header(self, header):
@@ -223,7 +432,7 @@ class _S3System(_SystemBase):
             int: Size in bytes.
         """
         try:
-            return header.pop("ContentLength")
+            return header["ContentLength"]
         except KeyError:
             raise _UnsupportedOperation("getsize")
 
@@ -244,9 +453,11 @@ class _S3System(_SystemBase):
             else:
                 header = self.client.head_bucket(**client_kwargs)
 
-        for key in ("AcceptRanges", "ResponseMetadata"):
-            header.pop(key, None)
-        return header
+        return {
+            key: value
+            for key, value in header.items()
+            if key not in _HEADER_EXCLUDED_KEYS
+        }
 
     def _make_dir(self, client_kwargs):
         """
@@ -279,6 +490,55 @@ class _S3System(_SystemBase):
 
             return self.client.delete_bucket(Bucket=client_kwargs["Bucket"])
 
+    def _remove_many(self, client_kwargs_list):
+        """
+        Remove several objects.
+
+        Objects are removed by batches of 1000 with "delete_objects". Buckets are
+        removed after objects. All objects and buckets are processed, then the first
+        error, if any, is raised.
+
+        args:
+            client_kwargs_list (list of dict): Client arguments of each object.
+        """
+        keys = dict()
+        buckets = []
+        for client_kwargs in client_kwargs_list:
+            if "Key" in client_kwargs:
+                keys.setdefault(client_kwargs["Bucket"], []).append(
+                    dict(Key=client_kwargs["Key"])
+                )
+            else:
+                buckets.append(client_kwargs)
+
+        errors = []
+        delete_objects = self.client.delete_objects
+        for bucket, objects in keys.items():
+            for index in range(0, len(objects), _MAX_DELETE_OBJECTS):
+                try:
+                    with _handle_client_error():
+                        response = delete_objects(
+                            Bucket=bucket,
+                            Delete=dict(
+                                Objects=objects[index : index + _MAX_DELETE_OBJECTS],
+                                Quiet=True,
+                            ),
+                        )
+                        # Quiet mode only returns keys that were not deleted
+                        for error in response.get("Errors", ()):
+                            raise _ClientError(dict(Error=error), "DeleteObjects")
+                except Exception as exception:
+                    errors.append(exception)
+
+        for client_kwargs in buckets:
+            try:
+                self._remove(client_kwargs)
+            except Exception as exception:
+                errors.append(exception)
+
+        if errors:
+            raise errors[0]
+
     def _list_locators(self, max_results):
         """
         Lists locators.
@@ -316,22 +576,22 @@ class _S3System(_SystemBase):
         index = len(prefix)
         kwargs = dict(Bucket=client_kwargs["Bucket"], Prefix=prefix)
         if max_results:
-            kwargs["MaxKeys"] = max_results
+            kwargs["PaginationConfig"] = dict(PageSize=max_results)
 
+        pages = iter(self.client.get_paginator("list_objects_v2").paginate(**kwargs))
         while True:
             with _handle_client_error():
-                response = self.client.list_objects_v2(**kwargs)
+                response = next(pages, None)
+            if response is None:
+                break
 
             try:
-                for obj in response["Contents"]:
-                    yield obj.pop("Key")[index:], obj, False
+                objects = response["Contents"]
             except KeyError:
                 raise _ObjectNotFoundError(path=path)
 
-            try:
-                kwargs["ContinuationToken"] = response["NextContinuationToken"]
-            except KeyError:
-                break
+            for obj in objects:
+                yield obj.pop("Key")[index:], obj, False
 
     def _shareable_url(self, client_kwargs, expires_in):
         """
@@ -368,34 +628,158 @@ class S3RawIO(_ObjectRawIOBase):
             May be optional if already configured on host.
         unsecure (bool): If True, disables TLS/SSL to improves transfer performance.
             But makes connection unsecure.
+        head_read_size (int): In read mode, size in bytes of the object start read
+            on opening instead of only requesting its header. 0 to only request the
+            header. Default to "HEAD_READ_SIZE".
     """
 
+    __slots__ = ("_head_content", "_head_read_size")
+
     _SYSTEM_CLASS = _S3System
 
-    def _read_range(self, start, end=0):
+    #: Size of the object start read with the header when opening in read mode
+    HEAD_READ_SIZE = 65536
+
+    def __init__(self, *args, **kwargs):
+        self._head_content = None
+        self._head_read_size = kwargs.get("head_read_size", self.HEAD_READ_SIZE)
+        _ObjectRawIOBase.__init__(self, *args, **kwargs)
+
+    def _reset_head(self):
         """
-        Read a range of bytes in stream.
+        Reset memoized head and associated values.
+        """
+        self._head_content = None
+        _ObjectRawIOBase._reset_head(self)
+
+    @_memoizedmethod
+    def _head(self):
+        """
+        Return file header.
+
+        In read mode, unless disabled with "head_read_size", the header is returned
+        by a GET request of the object start instead of a HEAD request. Small objects
+        are then fully read on opening, and reading them does not require another
+        request.
+
+        Returns:
+            dict: header.
+        """
+        if not self._writable and self._head_read_size:
+            response = self._get_object_range(0, self._head_read_size)
+            content_range = None if response is None else response.get("ContentRange")
+            if content_range is not None:
+                self._head_content = response["Body"].read()
+                header = {
+                    key: value
+                    for key, value in response.items()
+                    if key not in _GET_HEADER_EXCLUDED_KEYS
+                }
+                header["ContentLength"] = int(content_range.rsplit("/", 1)[1])
+                return header
+
+        return self._system.head(client_kwargs=self._client_kwargs)
+
+    def _get_head_content_range(self, start, end):
+        """
+        Get a range of bytes from the object start read with the header.
 
         Args:
             start (int): Start stream position.
             end (int): End stream position. 0 To not specify end.
 
         Returns:
-            bytes: number of bytes read
+            bytes or None: Content, None if range not available.
+        """
+        content = self._head_content
+        if content is None:
+            return None
+
+        size = len(content)
+        if size < self._size and not (end and end <= size):
+            return None
+        return content[start : end or None]
+
+    def _get_object_range(self, start, end):
+        """
+        Get a range of bytes of the object.
+
+        Args:
+            start (int): Start stream position.
+            end (int): End stream position. 0 To not specify end.
+
+        Returns:
+            dict or None: "get_object" response, None if out of range.
         """
+        # HTTP range formatted inline, this is called for each read buffer
+        http_range = f"bytes={start}-{end - 1}" if end else f"bytes={start}-"
         try:
             with _handle_client_error():
-                response = self._client.get_object(
-                    Range=self._http_range(start, end), **self._client_kwargs
-                )
+                return self._client.get_object(Range=http_range, **self._client_kwargs)
 
         except _ClientError as exception:
             if exception.response["Error"]["Code"] == "InvalidRange":
-                return bytes()
+                return None
             raise
 
+    def _read_range(self, start, end=0):
+        """
+        Read a range of bytes in stream.
+
+        Args:
+            start (int): Start stream position.
+            end (int): End stream position. 0 To not specify end.
+
+        Returns:
+            bytes: number of bytes read
+        """
+        content = self._get_head_content_range(start, end)
+        if content is not None:
+            return content
+
+        response = self._get_object_range(start, end)
+        if response is None:
+            return bytes()
         return response["Body"].read()
 
+    def _read_range_into(self, start, buffer):
+        """
+        Read a range of bytes in stream into a buffer.
+
+        Args:
+            start (int): Start stream position.
+            buffer (memoryview): Buffer.
+
+        Returns:
+            int: number of bytes read
+        """
+        size = len(buffer)
+        if self._get_head_content_range(start, start + size) is not None:
+            return _ObjectRawIOBase._read_range_into(self, start, buffer)
+
+        response = self._get_object_range(start, start + size)
+        if response is None:
+            return 0
+
+        # Reads from the underlying HTTP response to avoid an intermediate bytes
+        body = response["Body"]
+        readinto = getattr(body, "_raw_stream", body).readinto
+
+        read_size = 0
+        while read_size < size:
+            read = readinto(buffer[read_size:])
+            if not read:
+                break
+            read_size += read
+
+        # The underlying stream does not check the received size, like the body does
+        expected_size = response.get("ContentLength", read_size)
+        if read_size != expected_size:
+            raise _IncompleteReadError(
+                actual_bytes=read_size, expected_bytes=expected_size
+            )
+        return read_size
+
     def _readall(self):
         """
         Read and return all the bytes from the stream until EOF.
@@ -403,6 +787,10 @@ class S3RawIO(_ObjectRawIOBase):
         Returns:
             bytes: Object content
         """
+        content = self._get_head_content_range(0, 0)
+        if content is not None:
+            return content
+
         with _handle_client_error():
             return self._client.get_object(**self._client_kwargs)["Body"].read()
 
@@ -414,7 +802,7 @@ class S3RawIO(_ObjectRawIOBase):
             buffer (memoryview): Buffer content.
         """
         with _handle_client_error():
-            self._client.put_object(Body=buffer.tobytes(), **self._client_kwargs)
+            self._client.put_object(Body=_request_body(buffer), **self._client_kwargs)
 
 
 class S3BufferedIO(_ObjectBufferedIOBase):
@@ -436,9 +824,12 @@ class S3BufferedIO(_ObjectBufferedIOBase):
             May be optional if already configured on host.
         unsecure (bool): If True, disables TLS/SSL to improves transfer performance.
             But makes connection unsecure.
+        head_read_size (int): In read mode, size in bytes of the object start read
+            on opening instead of only requesting its header. 0 to only request the
+            header. Default to "S3RawIO.HEAD_READ_SIZE".
     """
 
-    __slots__ = ("_upload_args",)
+    __slots__ = ("_upload_args", "_upload_part", "_parts_numbers")
 
     _RAW_CLASS = S3RawIO
 
@@ -449,42 +840,61 @@ class S3BufferedIO(_ObjectBufferedIOBase):
         _ObjectBufferedIOBase.__init__(self, *args, **kwargs)
         if self._writable:
             self._upload_args = self._client_kwargs.copy()
+            self._upload_part = None
+            self._parts_numbers = dict()
 
     def _flush(self):
         """
         Flush the write buffers of the stream.
         """
-        if "UploadId" not in self._upload_args:
+        upload_part = self._upload_part
+        if upload_part is None:
             with _handle_client_error():
                 self._upload_args["UploadId"] = self._client.create_multipart_upload(
                     **self._client_kwargs
                 )["UploadId"]
 
-        response = self._workers.submit(
-            self._client.upload_part,
-            Body=self._get_buffer().tobytes(),
-            PartNumber=self._seek,
-            **self._upload_args,
+            # Arguments common to all parts are bound once
+            upload_part = self._upload_part = _partial(
+                self._client.upload_part, **self._upload_args
+            )
+
+        future = self._workers.submit(
+            upload_part, Body=_request_body(self._get_buffer()), PartNumber=self._seek
         )
 
-        self._write_futures.append(dict(response=response, PartNumber=self._seek))
+        self._write_futures.append(future)
+        self._parts_numbers[future] = self._seek
 
     def _close_writable(self):
         """
         Close the object in write mode.
         """
-        for part in self._write_futures:
-            part["ETag"] = part.pop("response").result()["ETag"]
+        parts_numbers = self._parts_numbers
+        futures = self._write_futures
+
+        try:
+            with _handle_client_error():
+                # Parts are checked as soon as uploaded, to abort early on error
+                parts = [
+                    dict(ETag=future.result()["ETag"], PartNumber=parts_numbers[future])
+                    for future in _as_completed(futures)
+                ]
+                parts.sort(key=_itemgetter("PartNumber"))
 
-        with _handle_client_error():
-            try:
                 self._client.complete_multipart_upload(
-                    MultipartUpload={"Parts": self._write_futures},
+                    MultipartUpload={"Parts": parts},
                     UploadId=self._upload_args["UploadId"],
                     **self._client_kwargs,
                 )
-            except _ClientError:
+
+        except BaseException:
+            # Parts still uploading after the abort would be kept and billed
+            for future in futures:
+                future.cancel()
+            _wait(futures)
+            with _handle_client_error():
                 self._client.abort_multipart_upload(
                     UploadId=self._upload_args["UploadId"], **self._client_kwargs
                 )
-                raise
+            raise
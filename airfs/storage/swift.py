@@ -52,6 +52,8 @@ class _SwiftSystem(_SystemBase):
     """
 
     __slots__ = ("_temp_url_key",)
+
+    _CACHE_CLIENT_KWARGS = True
     _SIZE_KEYS = ("content-length", "content_length", "bytes")
     _MTIME_KEYS = ("last-modified", "last_modified")
 
@@ -69,6 +71,7 @@ class _SwiftSystem(_SystemBase):
             self.client.copy_object(
                 container=container, obj=obj, destination=self.relpath(dst)
             )
+        self._head_cache.clear()
 
     def get_client_kwargs(self, path):
         """
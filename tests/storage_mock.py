@@ -139,6 +139,7 @@ class ObjectStorageMock:
 
                 headers[name] = header.copy()
                 del headers[name]["_content"]
+                headers[name].pop("_lock", None)
 
                 if len(headers) == limit:
                     break
@@ -259,18 +260,7 @@ class ObjectStorageMock:
             try:
                 file = self._get_locator_content(locator)[path]
             except KeyError:
-                self._get_locator_content(locator)[path] = file = {
-                    "Accept-Ranges": "bytes",
-                    "ETag": str(_uuid()),
-                    "_content": bytearray(),
-                    "_lock": _Lock(),
-                }
-
-                if self._header_size:
-                    file[self._header_size] = 0
-
-                if self._header_ctime:
-                    file[self._header_ctime] = self._format_date(_time())
+                self._get_locator_content(locator)[path] = file = self._new_object()
 
         # Update file
         with file["_lock"]:
@@ -304,9 +294,54 @@ class ObjectStorageMock:
                 file[self._header_mtime] = self._format_date(_time())
 
             header = file.copy()
-        del header["_content"]
+        del header["_content"], header["_lock"]
         return header
 
+    def put_objects(self, locator, objects):
+        """
+        Put several new objects at once.
+
+        Existing objects are replaced.
+
+        Args:
+            locator (str): locator name
+            objects (iterable of tuple): Objects paths and contents.
+        """
+        locator_content = self._get_locator_content(locator)
+        with self._put_lock:
+            locator_content.update(
+                (path, self._new_object(content)) for path, content in objects
+            )
+
+    def _new_object(self, content=b""):
+        """
+        Return a new object.
+
+        Args:
+            content (bytes like-object): File content.
+
+        Returns:
+            dict: File.
+        """
+        file = {
+            "Accept-Ranges": "bytes",
+            "ETag": str(_uuid()),
+            "_content": bytearray(content),
+            "_lock": _Lock(),
+        }
+
+        if self._header_size:
+            file[self._header_size] = len(content)
+
+        if self._header_ctime or self._header_mtime:
+            date = self._format_date(_time())
+            if self._header_ctime:
+                file[self._header_ctime] = date
+            if self._header_mtime:
+                file[self._header_mtime] = date
+
+        return file
+
     def concat_objects(self, locator, path, parts):
         """
         Concatenates objects as one object.
@@ -421,7 +456,7 @@ class ObjectStorageMock:
             dict: header.
         """
         header = self._get_object(locator, path).copy()
-        del header["_content"]
+        del header["_content"], header["_lock"]
         return header
 
     def get_object_ctime(self, locator, path):
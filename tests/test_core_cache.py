@@ -6,13 +6,14 @@ def test_hash_name():
     """Test airfs._core.cache._hash_name"""
     from airfs._core.cache import _hash_name
 
-    assert len(_hash_name("test")) == 64, "Hash length"
+    assert len(_hash_name("test")) == 24, "Hash length"
 
 
 def test_cache(tmpdir):
     """Test cache functions"""
     import airfs._core.cache as cache
-    from time import sleep
+    from os import utime
+    from time import sleep, time
 
     value_short = dict(key1=1, key2="1")
     value_long = dict(key3="", key4=True)
@@ -36,6 +37,21 @@ def test_cache(tmpdir):
         assert cache.get_cache(name_long) == value_long
         assert tmpdir.join(hash_long).check(file=1)
 
+        # Test long cache expiry reset once the file is old enough
+        old_time = time() - cache._LONG_CACHE_REFRESH_DELAY - 1
+        utime(tmpdir.join(hash_long), (old_time, old_time))
+        assert cache.get_cache(name_long) == value_long
+        assert tmpdir.join(hash_long).mtime() > old_time + 1
+
+        # Test in memory cache, returned objects are not shared
+        obj = cache.get_cache(name_short)
+        assert obj is not cache.get_cache(name_short)
+        obj["key1"] = 2
+        assert cache.get_cache(name_short) == value_short
+        tmpdir.join(hash_short).write_binary(cache.compress(b'{"key5": 5}'))
+        assert cache.get_cache(name_short) == dict(key5=5), "Updated file"
+        cache.set_cache(name_short, value_short)
+
         # Test short expired
         cache.CACHE_SHORT_EXPIRY = 1e-9
         sleep(0.01)
@@ -65,7 +81,42 @@ def test_cache(tmpdir):
         cache.clear_cache()
         assert not tmpdir.join(hash_short).check()
 
+        # Test file in a previous format
+        cache.CACHE_SHORT_EXPIRY = 60
+        tmpdir.join(hash_short).write_binary(b"not compressed")
+        with pytest.raises(cache.NoCacheException):
+            cache.get_cache(name_short)
+        assert not tmpdir.join(hash_short).check()
+
     finally:
         cache.CACHE_DIR = cache_dir
         cache.CACHE_LONG_EXPIRY = long_expiry
         cache.CACHE_SHORT_EXPIRY = short_expiry
+
+
+def test_cache_in_memory(tmpdir, monkeypatch):
+    """Test cache objects are served from memory after being set"""
+    import airfs._core.cache as cache
+
+    def cache_open(*_, **__):
+        """Cache file must not be read"""
+        raise AssertionError("Cache file read")
+
+    def cache_utime(*_, **__):
+        """Recent long cache file expiry must not be reset"""
+        raise AssertionError("Cache file expiry reset")
+
+    cache_dir = cache.CACHE_DIR
+    cache.CACHE_DIR = str(tmpdir)
+    try:
+        for name, long in (("short", False), ("long", True)):
+            value = dict(name=name)
+            cache.set_cache(name, value, long=long)
+            value["name"] = "updated"
+            with monkeypatch.context() as patch:
+                patch.setattr(cache, "open", cache_open, raising=False)
+                patch.setattr(cache, "utime", cache_utime)
+                assert cache.get_cache(name) == dict(name=name), "Get from memory"
+                assert cache.get_cache(name) == dict(name=name), "Get again"
+    finally:
+        cache.CACHE_DIR = cache_dir
@@ -652,3 +652,24 @@ def test_is_storage():
 
     # Local file descriptor
     assert not is_storage(1)
+
+
+def test_prefetch():
+    """Tests airfs._core.functions_core.prefetch"""
+    from airfs._core.functions_core import prefetch
+
+    assert list(prefetch(range(10), size=2)) == list(range(10))
+
+    def raises():
+        """Yields then raises"""
+        yield 1
+        raise ValueError
+
+    generator = prefetch(raises())
+    assert next(generator) == 1
+    with pytest.raises(ValueError):
+        next(generator)
+
+    generator = prefetch(iter(range(10)), size=1)
+    assert next(generator) == 0
+    generator.close()
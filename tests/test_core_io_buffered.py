@@ -53,6 +53,12 @@ def test_object_buffered_base_io():
             """Returns fake result"""
             return {}
 
+        _cached_client_kwargs = get_client_kwargs
+
+        @staticmethod
+        def clear_head_cache():
+            """Do nothing"""
+
     class DummyRawIO(ObjectRawIOBase):
         """Dummy IO"""
 
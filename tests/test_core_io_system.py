@@ -118,9 +118,31 @@ def test_system_base():
     assert system.getmtime("path") == m_time
     object_header["Last-Modified"] = format_date_time(m_time)
 
+    # Tests head cache
+    cached_system = DummySystem(storage_parameters={"airfs.head_cache_ttl": 60})
+    assert "airfs.head_cache_ttl" not in cached_system.storage_parameters
+    assert cached_system.getsize("path") == size
+    object_header["Content-Length"] = str(size + 1)
+    assert system.getsize("path") == size + 1
+    assert cached_system.getsize("path") == size, "Cached header"
+    cached_system.remove("root://locator/path")
+    assert cached_system.getsize("path") == size + 1, "Cache cleared"
+    object_header["Content-Length"] = str(size)
+
     # Tests "relpath"
     assert system.relpath("scheme://path") == "path"
     assert system.relpath("path") == "path"
+    assert system.relpath("root2://path") == "path"
+    assert system.relpath("root2://root://path") == "root://path", "Roots order"
+    assert system.relpath("scheme://root://path") == "path", "Roots order"
+
+    system_roots = system.roots
+    system.roots = ("other://",)
+    assert system.relpath("root2://path") == "root2://path", "Roots updated"
+    assert system.is_abs("other://path"), "Roots updated"
+    assert not system.is_abs("root2://path"), "Roots updated"
+    system.roots = system_roots
+    assert system.relpath("root2://path") == "path"
 
     # Tests "is_abs"
     assert system.is_abs("root://path")
@@ -190,6 +212,7 @@ def test_system_base():
     system.remove("locator", relative=True)
     system.remove("locator/path", relative=True)
     system.remove("locator/path/", relative=True)
+    system._remove_many((dummy_client_kwargs, dummy_client_kwargs))
 
     # Tests stat
     object_header["Content-Length"] = "0"
@@ -209,6 +232,8 @@ def test_system_base():
     assert stat_result.st_mtime == pytest.approx(m_time, 1)
     assert stat_result.st_ctime == 0
     assert stat_result.etag == object_header["ETag"]
+    assert stat_result[6] == size, "Indexable like os.stat_result"
+    assert isinstance(stat_result, tuple)
 
     def islink(header=None, **_):
         """Checks arguments and returns fake result"""
@@ -238,3 +263,75 @@ def test_system_base():
     assert list(system.list_objects(path="locator", relative=True)) == [
         (obj, object_header) for obj in objects
     ]
+
+    # Tests list_objects of all locators, with and without concurrent listing
+    locators = ("locator", "locator_empty")
+    expected = [("locator/", object_header), ("locator_empty/", object_header)]
+    expected += [(f"locator/{obj}", object_header) for obj in objects]
+    assert list(system.list_objects(path="root://")) == expected
+    assert list(system.list_objects(path="root://", prefetch=True)) == expected
+    system._CONCURRENT_LISTING = False
+    assert list(system.list_objects(path="root://")) == expected
+
+
+def test_list_sub_dirs_concurrently():
+    """Tests airfs._core.io_system.SystemBase concurrent listing"""
+    from airfs._core.io_base_system import SystemBase
+
+    max_workers = 2
+    dirs = [f"dir{index}" for index in range(10)]
+    started = []
+
+    class DummySystem(SystemBase):
+        """Dummy System"""
+
+        def get_client_kwargs(self, path):
+            """Returns fake result"""
+            return dict(path=path)
+
+        def _get_client(self):
+            """Returns fake result"""
+
+        def _get_roots(self):
+            """Returns fake result"""
+            return ("root://",)
+
+        def _head(self, client_kwargs):
+            """Returns fake result"""
+            return dict()
+
+        def _list_objects(self, client_kwargs, *_, **__):
+            """Returns fake result and track started sub directories listings"""
+            path = client_kwargs["path"]
+            if path == "locator":
+                for sub_dir in dirs:
+                    yield sub_dir, dict(), True
+                return
+
+            started.append(path)
+
+            # First sub directories are the slowest to list
+            time.sleep(0.002 * (len(dirs) - dirs.index(path.rsplit("/", 1)[-1])))
+            yield "object", dict(), False
+
+    system = DummySystem()
+    system._workers_count = max_workers
+
+    objects = []
+    for obj, _ in system.list_objects("locator", relative=True):
+        objects.append(obj)
+        if obj.endswith("/object"):
+            # Slow caller, listings must not run far ahead
+            time.sleep(0.05)
+            assert (
+                len(started) <= len(objects) - len(dirs) + max_workers
+            ), "In-flight listings limited to workers count"
+
+    assert sorted(objects) == sorted(
+        [f"{sub_dir}/" for sub_dir in dirs] + [f"{sub_dir}/object" for sub_dir in dirs]
+    ), "All sub directories listed"
+
+    DummySystem._CONCURRENT_LISTING = False
+    assert objects == [
+        obj for obj, _ in system.list_objects("locator", relative=True)
+    ], "Same order as sequential listing"
@@ -1,17 +1,39 @@
 """Test airfs.storage"""
+from collections import deque as _deque
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
 from copy import deepcopy as _deepcopy
-from os import urandom as _os_urandom
+from functools import lru_cache as _lru_cache
+from io import UnsupportedOperation as _UnsupportedOperation
+from os import urandom as _os_urandom, SEEK_CUR as _SEEK_CUR, SEEK_END as _SEEK_END
 from time import time as _time
-from uuid import uuid4 as _uuid
 
 import pytest as _pytest
 import requests as _requests
 
+from airfs._core.exceptions import (
+    ObjectNotFoundError as _ObjectNotFoundError,
+    ObjectUnsupportedOperation as _ObjectUnsupportedOperation,
+    ObjectNotImplementedError as _ObjectNotImplementedError,
+    ObjectNotASymlinkError as _ObjectNotASymlinkError,
+)
+from airfs._core.io_base_system import _STAT_KEY_TABLE
+from airfs.io import ObjectBufferedIOBase as _ObjectBufferedIOBase
 
+#: Pool of unique IDs, generated by batches
+_ID_POOL = _deque()
+_ID_POOL_SIZE = 128
+
+#: Null bytes to compare with
+_ZEROS = bytes(64)
+
+
+@_lru_cache(maxsize=8)
 def _urandom(size):
     """
     Return random generated bytes. But avoid to generate Null chars.
 
+    Bytes are generated once per size and reused, since tests only compare them.
+
     Args:
         size (int):
 
@@ -77,13 +99,12 @@ class StorageTester:
 
         # Defines randomized names for locator and objects
         self.locator = self._get_id()
-        self.locator_url = "/".join((root, self.locator))
+        self.locator_url = f"{root}/{self.locator}"
         self.base_dir_name = f"{self._get_id()}/"
         if path_prefix:
-            dir_parts = (self.locator, path_prefix, self.base_dir_name)
+            self.base_dir_path = f"{self.locator}/{path_prefix}/{self.base_dir_name}"
         else:
-            dir_parts = (self.locator, self.base_dir_name)
-        self.base_dir_path = "/".join(dir_parts)
+            self.base_dir_path = f"{self.locator}/{self.base_dir_name}"
         self.base_dir_url = root + self.base_dir_path
 
         # Run test sequence
@@ -94,17 +115,25 @@ class StorageTester:
         return self
 
     def __exit__(self, exc_type, exc_value, exc_traceback):
-        from airfs._core.exceptions import (
-            ObjectNotFoundError,
-            ObjectUnsupportedOperation,
-        )
-
-        # Remove objects, and once empty the locator
-        for obj in reversed(sorted(self._objects, key=str.lower)):
-            self._objects.discard(obj)
+        # Remove files in a single batch, then directories and once empty the locator
+        objects = sorted(self._objects, reverse=True)
+        self._objects.clear()
+        files = [obj for obj in objects if "/" in obj and not obj.endswith("/")]
+        get_client_kwargs = self._system.get_client_kwargs
+        try:
+            self._system._remove_many([get_client_kwargs(obj) for obj in files])
+        except _ObjectNotFoundError:
+            # Files already removed by tests, others are removed anyway
+            pass
+        except _ObjectUnsupportedOperation:
+            files = ()
+        files = set(files)
+        objects = [obj for obj in objects if obj not in files]
+
+        for obj in objects:
             try:
                 self._system.remove(obj, relative=True)
-            except (ObjectNotFoundError, ObjectUnsupportedOperation):
+            except (_ObjectNotFoundError, _ObjectUnsupportedOperation):
                 continue
 
     def test_common(self):
@@ -121,6 +150,11 @@ class StorageTester:
         if self._storage_mock is not None:
             self._test_mock_only()
 
+        # Sample files can only be created by writing them or by putting them on
+        # the mock, tests that read them stop after unsupported operations checks
+        elif not self._is_supported("write"):
+            _pytest.skip("Tests reading files require write support or a mock")
+
     def _is_supported(self, feature):
         """
         Return True if a feature is supported.
@@ -141,15 +175,17 @@ class StorageTester:
         Returns:
             str: id
         """
-        return f"airfs{str(_uuid()).replace('-', '')}"
+        if not _ID_POOL:
+            ids = _os_urandom(16 * _ID_POOL_SIZE).hex()
+            _ID_POOL.extend(
+                f"airfs{ids[index:index + 32]}" for index in range(0, len(ids), 32)
+            )
+        return _ID_POOL.popleft()
 
     def _test_raw_io(self):
         """
         Tests raw IO.
         """
-        from os import SEEK_END, SEEK_CUR
-        from io import UnsupportedOperation
-
         size = 100
         file_name = "raw_file0.dat"
         file_path = self.base_dir_path + file_name
@@ -196,17 +232,17 @@ class StorageTester:
 
                 else:
                     # Test not seekable raises Unsupported exception
-                    with _pytest.raises(UnsupportedOperation):
+                    with _pytest.raises(_UnsupportedOperation):
                         file.tell()
 
-                    with _pytest.raises(UnsupportedOperation):
+                    with _pytest.raises(_UnsupportedOperation):
                         file.seek(0)
 
                 # Test: read in write mode is not supported
-                with _pytest.raises(UnsupportedOperation):
+                with _pytest.raises(_UnsupportedOperation):
                     file.read()
 
-                with _pytest.raises(UnsupportedOperation):
+                with _pytest.raises(_UnsupportedOperation):
                     file.readinto(bytearray(100))
 
         else:
@@ -214,14 +250,15 @@ class StorageTester:
             max_flush_size = 0
 
             # Test: Unsupported
-            with _pytest.raises(UnsupportedOperation):
+            with _pytest.raises(_UnsupportedOperation):
                 self._raw_io(file_path, "wb", **self._system_parameters)
 
             # Create pre-existing file
-            if self._storage_mock:
-                self._storage_mock.put_object(
-                    self.locator, self.base_dir_name + file_name, content
-                )
+            if not self._storage_mock:
+                return
+            self._storage_mock.put_object(
+                self.locator, self.base_dir_name + file_name, content
+            )
 
         # Open file in read mode
         with self._raw_io(file_path, **self._system_parameters) as file:
@@ -238,7 +275,7 @@ class StorageTester:
 
             # Test: seek from current position & read_all
             assert (
-                file.seek(-50, SEEK_CUR) == 50
+                file.seek(-50, _SEEK_CUR) == 50
             ), "Raw seek from current & read all, seek match"
             assert (
                 file.readall() == content[-50:]
@@ -250,7 +287,7 @@ class StorageTester:
                 file.seek(0, 10)
 
             # Test: Cannot write in read mode
-            with _pytest.raises(UnsupportedOperation):
+            with _pytest.raises(_UnsupportedOperation):
                 file.write(b"0")
 
             # Test: Flush has no effect in read mode
@@ -259,11 +296,11 @@ class StorageTester:
             # Test: _read_range
             assert file.seek(0) == 0, "Raw seek 0, seek match"
             buffer = bytearray(40)
+            buffer_view = memoryview(buffer)
             assert file.readinto(buffer) == 40, "Raw read into, returned size match"
             assert bytes(buffer) == content[:40], "Raw read into, content match"
             assert file.tell() == 40, "Raw read into, tell match"
 
-            buffer = bytearray(40)
             assert (
                 file.readinto(buffer) == 40
             ), "Raw read into from 40, returned size match"
@@ -272,29 +309,29 @@ class StorageTester:
             ), "Raw read into from 40, content match"
             assert file.tell() == 80, "Raw read into from 40, tell match"
 
-            buffer = bytearray(40)
+            buffer_view[:] = _ZEROS[:40]
             assert (
                 file.readinto(buffer) == 20
             ), "Raw read into partially over EOF, returned size match"
             assert (
-                bytes(buffer) == content[80:] + b"\0" * 20
+                buffer_view[:20] == content[80:] and buffer_view[20:] == _ZEROS[:20]
             ), "Raw read into partially over EOF, content match"
             assert file.tell() == size, "Raw read into partially over EOF, tell match"
 
-            buffer = bytearray(40)
+            buffer_view[:] = _ZEROS[:40]
             assert (
                 file.readinto(buffer) == 0
             ), "Raw read into over EOF, returned size match"
-            assert bytes(buffer) == b"\0" * 40, "Raw read into over EOF, content match"
+            assert buffer_view == _ZEROS[:40], "Raw read into over EOF, content match"
             assert file.tell() == size, "Raw read into over EOF, tell match"
 
-            file.seek(-10, SEEK_END)
-            buffer = bytearray(20)
+            file.seek(-10, _SEEK_END)
+            buffer_view[:20] = _ZEROS[:20]
             assert (
-                file.readinto(buffer) == 10
+                file.readinto(buffer_view[:20]) == 10
             ), "Raw seek from end & read into, returned size match"
             assert (
-                bytes(buffer) == content[90:] + b"\0" * 10
+                buffer_view[:10] == content[90:] and buffer_view[10:20] == _ZEROS[:10]
             ), "Raw seek from end & read into, content match"
             assert file.tell() == size, "Raw seek from end & read into, tell match"
 
@@ -368,18 +405,17 @@ class StorageTester:
         """
         Tests buffered IO.
         """
-        from airfs.io import ObjectBufferedIOBase
-        from io import UnsupportedOperation
-
         # Set buffer size
         buffer_size = 16 * 1024
 
+        # Contents do not need to differ between files, generate it once
+        full_content = _urandom(5 * buffer_size)
+
         # Test: write data, not multiple of buffer
         file_name = "buffered_file0.dat"
         file_path = self.base_dir_path + file_name
         self._to_clean(file_path)
-        size = int(4.5 * buffer_size)
-        content = _urandom(size)
+        content = full_content[: int(4.5 * buffer_size)]
 
         if self._is_supported("write"):
             with self._buffered_io(
@@ -388,16 +424,17 @@ class StorageTester:
                 file.write(content)
         else:
             # Test: Unsupported
-            with _pytest.raises(UnsupportedOperation):
+            with _pytest.raises(_UnsupportedOperation):
                 self._buffered_io(
                     file_path, "wb", buffer_size=buffer_size, **self._system_parameters
                 )
 
             # Create pre-existing file
-            if self._storage_mock:
-                self._storage_mock.put_object(
-                    self.locator, self.base_dir_name + file_name, content
-                )
+            if not self._storage_mock:
+                return
+            self._storage_mock.put_object(
+                self.locator, self.base_dir_name + file_name, content
+            )
 
         # Test: Read data, not multiple of buffer
         with self._buffered_io(
@@ -409,8 +446,7 @@ class StorageTester:
         file_name = "buffered_file1.dat"
         file_path = self.base_dir_path + file_name
         self._to_clean(file_path)
-        size = int(5 * buffer_size)
-        content = _urandom(size)
+        content = full_content
 
         if self._is_supported("write"):
             with self._buffered_io(
@@ -422,27 +458,27 @@ class StorageTester:
                 file.flush()
 
                 # Test: read in write mode is not supported
-                with _pytest.raises(UnsupportedOperation):
+                with _pytest.raises(_UnsupportedOperation):
                     file.read()
 
-                with _pytest.raises(UnsupportedOperation):
+                with _pytest.raises(_UnsupportedOperation):
                     file.read1()
 
-                with _pytest.raises(UnsupportedOperation):
+                with _pytest.raises(_UnsupportedOperation):
                     file.readinto(bytearray(100))
 
-                with _pytest.raises(UnsupportedOperation):
+                with _pytest.raises(_UnsupportedOperation):
                     file.readinto1(bytearray(100))
 
-                with _pytest.raises(UnsupportedOperation):
+                with _pytest.raises(_UnsupportedOperation):
                     file.peek()
 
                 # Test: Unsupported if not seekable
                 if not file.seekable():
-                    with _pytest.raises(UnsupportedOperation):
+                    with _pytest.raises(_UnsupportedOperation):
                         file.tell()
 
-                    with _pytest.raises(UnsupportedOperation):
+                    with _pytest.raises(_UnsupportedOperation):
                         file.seek(0)
         else:
             # Create pre-existing file
@@ -470,14 +506,14 @@ class StorageTester:
             assert file.tell() == 10, "Buffered read, peek tell match"
 
             # Test: Cannot write in read mode
-            with _pytest.raises(UnsupportedOperation):
+            with _pytest.raises(_UnsupportedOperation):
                 file.write(b"0")
 
             # Test: Flush has no effect in read mode
             file.flush()
 
             # Check if airfs subclass
-            is_rfs_subclass = isinstance(file, ObjectBufferedIOBase)
+            is_rfs_subclass = isinstance(file, _ObjectBufferedIOBase)
 
         # Test: Buffer limits and default values
         if is_rfs_subclass:
@@ -530,8 +566,6 @@ class StorageTester:
         """
         Test system internals related to locators.
         """
-        from airfs._core.exceptions import ObjectUnsupportedOperation
-
         system = self._system
 
         # Test: Create locator
@@ -540,7 +574,7 @@ class StorageTester:
             self._to_clean(self.locator)
         else:
             # Test: Unsupported
-            with _pytest.raises(ObjectUnsupportedOperation):
+            with _pytest.raises(_ObjectUnsupportedOperation):
                 system.make_dir(self.locator_url)
 
             # Create a preexisting locator
@@ -561,7 +595,7 @@ class StorageTester:
             ), "List locators, header is mapping"
         else:
             # Test: Unsupported
-            with _pytest.raises(ObjectUnsupportedOperation):
+            with _pytest.raises(_ObjectUnsupportedOperation):
                 system._list_locators(None)
 
         # Test: remove locator
@@ -586,20 +620,13 @@ class StorageTester:
                 ], "Remove locator, locator not exists"
         else:
             # Test: Unsupported
-            with _pytest.raises(ObjectUnsupportedOperation):
+            with _pytest.raises(_ObjectUnsupportedOperation):
                 system.remove(tmp_locator)
 
     def _test_system_objects(self):
         """
         Test system internals related to objects.
         """
-        from airfs._core.exceptions import (
-            ObjectNotFoundError,
-            ObjectUnsupportedOperation,
-            ObjectNotImplementedError,
-            ObjectNotASymlinkError,
-        )
-
         system = self._system
 
         if self._is_supported("mkdir"):
@@ -658,42 +685,73 @@ class StorageTester:
                 self.locator, self.base_dir_name + file_name, content
             )
 
+        else:
+            # Test: Unsupported
+            with _pytest.raises(_UnsupportedOperation):
+                self._raw_io(file_path, mode="w", **self._system_parameters)
+            return
+
         # Estimate creation time
         create_time = _time()
 
         # Test: Check file header
-        assert hasattr(
-            system.head(path=file_path), "__getitem__"
-        ), "Head file, header is mapping"
+        header = system.head(path=file_path)
+        assert hasattr(header, "__getitem__"), "Head file, header is mapping"
+
+        # Test: stat contains header keys, except ones converted to "st_*" fields
+        stat_fields = system.stat(file_path, header=header)._fields
+        for key in header:
+            if key not in system._STAT_EXCLUDED_KEYS:
+                assert (
+                    key.lower().translate(_STAT_KEY_TABLE) in stat_fields
+                ), "Stat, header key in fields"
 
         # Test: Check file size
         try:
+            assert (
+                system.getsize(file_path, header=header) == size
+            ), "Head file, size match"
+
+            # Without header, requests it
+            system.clear_head_cache()
             assert system.getsize(file_path) == size, "Head file, size match"
-        except ObjectUnsupportedOperation:
+        except _ObjectUnsupportedOperation:
             # May not be supported on all files, if supported
             if self._is_supported("getsize"):
                 raise
 
         # Test: Check file modification time
         try:
-            file_time = system.getmtime(file_path)
+            file_time = system.getmtime(file_path, header=header)
             if self._is_supported("write"):
                 assert file_time == _pytest.approx(
                     create_time, 2
                 ), "Head file, modification time match"
-        except ObjectUnsupportedOperation:
+
+            # Without header, requests it
+            system.clear_head_cache()
+            assert (
+                system.getmtime(file_path) == file_time
+            ), "Head file, modification time match"
+        except _ObjectUnsupportedOperation:
             # May not be supported on all files, if supported
             if self._is_supported("getmtime"):
                 raise
 
         # Test: Check file creation time
         try:
-            file_time = system.getctime(file_path)
+            file_time = system.getctime(file_path, header=header)
             if self._is_supported("write"):
                 assert file_time == _pytest.approx(
                     create_time, 2
                 ), "Head file, creation time match"
-        except ObjectUnsupportedOperation:
+
+            # Without header, requests it
+            system.clear_head_cache()
+            assert (
+                system.getctime(file_path) == file_time
+            ), "Head file, creation time match"
+        except _ObjectUnsupportedOperation:
             # May not be supported on all files, if supported
             if self._is_supported("getctime"):
                 raise
@@ -705,28 +763,31 @@ class StorageTester:
         with self._raw_io(file_url, **self._system_parameters) as file:
             assert file.name == file_url, "Open file, URL match"
 
-        # Write some files
-        files = set()
-        files.add(file_path)
-        for i in range(11):
-            if i < 10:
-                # Files in directory
-                file_name = f"file{i}.dat"
-                path = self.base_dir_path + file_name
-                rel_path = self.base_dir_name + file_name
-            else:
-                # File in locator
-                rel_path = self._get_id() + ".dat"
-                path = f"{self.locator}/{rel_path}"
+        # Write some files in directory
+        new_files = {
+            f"{self.base_dir_path}file{i}.dat": f"{self.base_dir_name}file{i}.dat"
+            for i in range(10)
+        }
+
+        # Write a file in locator
+        rel_path = self._get_id() + ".dat"
+        new_files[f"{self.locator}/{rel_path}"] = rel_path
 
-            files.add(path)
+        files = {file_path, *new_files}
+        for path in new_files:
             self._to_clean(path)
-            if self._is_supported("write"):
-                with self._raw_io(path, mode="w", **self._system_parameters) as file:
-                    file.flush()
-            elif self._storage_mock:
-                # Create pre-existing file
-                self._storage_mock.put_object(self.locator, rel_path, b"")
+
+        if self._is_supported("write"):
+            # Files are independent, create them concurrently
+            with _ThreadPoolExecutor(max_workers=len(new_files)) as executor:
+                for _ in executor.map(self._create_empty_file, new_files):
+                    continue
+
+        elif self._storage_mock:
+            # Create pre-existing files
+            self._storage_mock.put_objects(
+                self.locator, ((rel_path, b"") for rel_path in new_files.values())
+            )
 
         # Test: List objects
         if self._is_supported("listdir"):
@@ -745,31 +806,33 @@ class StorageTester:
             assert entries == max_results, "List objects, Number of entries match"
 
             # Test: List objects, no objects found
-            with _pytest.raises(ObjectNotFoundError):
+            with _pytest.raises(_ObjectNotFoundError):
                 list(system.list_objects(self.base_dir_path + "dir_not_exists/"))
 
             # Test: List objects on locator root, no objects found
-            with _pytest.raises(ObjectNotFoundError):
+            with _pytest.raises(_ObjectNotFoundError):
                 list(system.list_objects(self.locator + "/dir_not_exists/"))
 
             # Test: List objects, locator not found
-            with _pytest.raises(ObjectNotFoundError):
+            with _pytest.raises(_ObjectNotFoundError):
                 list(system.list_objects(self._get_id()))
 
         else:
             # Test: Unsupported
-            with _pytest.raises(ObjectUnsupportedOperation):
+            with _pytest.raises(_ObjectUnsupportedOperation):
                 list(system.list_objects(self.base_dir_path))
 
         # Test: copy
         copy_path = file_path + ".copy"
         self._to_clean(copy_path)
         if self._is_supported("copy"):
+            system._head_cache[copy_path] = (float("inf"), dict())
             system.copy(file_path, copy_path)
+            assert not system._head_cache, "Copy file, head cache cleared"
             assert system.getsize(copy_path) == size, "Copy file, size match"
         else:
             # Test: Unsupported
-            with _pytest.raises(ObjectUnsupportedOperation):
+            with _pytest.raises(_ObjectUnsupportedOperation):
                 system.copy(file_path, copy_path)
 
         # Test: Normal file is not symlink
@@ -783,7 +846,7 @@ class StorageTester:
 
             try:
                 system.symlink(file_path, link_path)
-            except ObjectUnsupportedOperation:
+            except _ObjectUnsupportedOperation:
                 # Some systems only support symlinks for reading
                 # Put a symlink directly on the mock in this case
                 self._storage_mock.put_symlink(
@@ -793,7 +856,7 @@ class StorageTester:
             assert system.islink(link_path)
             assert system.read_link(link_path) == file_path
 
-            with _pytest.raises(ObjectNotASymlinkError):
+            with _pytest.raises(_ObjectNotASymlinkError):
                 system.read_link(self.locator)
 
         # Test: Shared file
@@ -812,7 +875,7 @@ class StorageTester:
                 assert system.shareable_url(self.locator, 60).startswith(
                     "http"
                 ), "Shareable locator URL"
-            except ObjectNotImplementedError:
+            except _ObjectNotImplementedError:
                 pass
 
             # Test share directory (If supported)
@@ -820,30 +883,38 @@ class StorageTester:
                 assert system.shareable_url(dir_path0, 60).startswith(
                     "http"
                 ), "Shareable directory URL"
-            except ObjectNotImplementedError:
+            except _ObjectNotImplementedError:
                 pass
 
         else:
             # Test: Unsupported
-            with _pytest.raises(ObjectNotImplementedError):
+            with _pytest.raises(_ObjectNotImplementedError):
                 system.shareable_url(file_path, 60)
 
         # Test: Remove file
         if self._is_supported("remove"):
-            if self._is_supported("listdir"):
-                assert (
-                    file_path in self._list_objects_names()
-                ), "Remove file, file exists"
+            # File existence was already checked by the list objects test
             system.remove(file_path)
+            self._objects.discard(file_path)
             if self._is_supported("listdir"):
                 assert (
                     file_path not in self._list_objects_names()
                 ), "Remove file, file not exists"
         else:
             # Test: Unsupported
-            with _pytest.raises(ObjectUnsupportedOperation):
+            with _pytest.raises(_ObjectUnsupportedOperation):
                 system.remove(file_path)
 
+    def _create_empty_file(self, path):
+        """
+        Create an empty file.
+
+        Args:
+            path (str): File path.
+        """
+        with self._raw_io(path, mode="w", **self._system_parameters) as file:
+            file.flush()
+
     def _test_mock_only(self):
         """
         Tests that can only be performed on mocks
@@ -877,10 +948,8 @@ class StorageTester:
         Returns:
             set of str: objects names.
         """
-        return set(
-            f"{self.locator}/{name}"
-            for name, _ in self._system.list_objects(self.locator)
-        )
+        prefix = f"{self.locator}/"
+        return {prefix + name for name, _ in self._system.list_objects(self.locator)}
 
 
 def test_user_storage(storage_test_kwargs):
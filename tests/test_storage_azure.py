@@ -111,9 +111,11 @@ def test_get_time():
     m_time = time()
     last_modified = datetime.fromtimestamp(m_time)
 
+    header = {"last_modified": last_modified}
     assert _AzureBaseSystem._get_time(
-        {"last_modified": last_modified}, ("last_modified",), "gettime"
+        header, ("last_modified",), "gettime"
     ) == pytest.approx(m_time, 1)
+    assert header == {"last_modified": last_modified}, "Header not modified"
 
     with pytest.raises(ObjectUnsupportedOperation):
         _AzureBaseSystem._get_time({}, ("last_modified",), "gettime")
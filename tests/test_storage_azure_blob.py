@@ -341,6 +341,17 @@ def test_mocked_storage():
             # Common tests
             tester.test_common()
 
+            # Test: Connection pool sized for the system workers count
+            session = system._secured_storage_parameters()["request_session"]
+            assert session.get_adapter("https://")._pool_maxsize == (
+                system._workers_count
+            ), "Pool size"
+
+            # Test: stat fields
+            stat_fields = system.stat(tester.base_dir_path + "file0.dat")._fields
+            assert "content_length" in stat_fields, "Stat, size key kept"
+            assert "last_modified" not in stat_fields, "Stat, mtime key excluded"
+
             # Test blob type
             assert system._default_blob_type == blob_type
             with AzureBlobRawIO(
@@ -296,6 +296,11 @@ def test_mocked_storage():
             # Common tests
             tester.test_common()
 
+            # Test: stat fields
+            stat_fields = system.stat(tester.base_dir_path + "file0.dat")._fields
+            assert "content_length" in stat_fields, "Stat, size key kept"
+            assert "last_modified" not in stat_fields, "Stat, mtime key excluded"
+
             # Test: Unsecure mode
             file_path = tester.base_dir_path + "file0.dat"
             with AzureFileRawIO(file_path, unsecure=True, **system_parameters) as file:
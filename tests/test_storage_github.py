@@ -1,4 +1,5 @@
 """Test airfs.storage.github"""
+from hashlib import blake2b
 import json
 import pickle
 from os.path import realpath, join
@@ -22,6 +23,21 @@ UPDATE_MOCK = False
 MOCK_DIR = realpath(join(__file__, "../resources/github_mock_responses"))
 
 
+def _mock_path(url, params):
+    """
+    Path of the saved response of a request.
+
+    Args:
+        url (str): Request URL.
+        params (dict): Request parameters.
+
+    Returns:
+        str: Saved response path.
+    """
+    name = url + json.dumps(params or dict())
+    return join(MOCK_DIR, blake2b(name.encode(), digest_size=32).hexdigest())
+
+
 class MockResponse:
     """Mocked request.Response"""
 
@@ -89,10 +105,7 @@ def test_github_storage(tmpdir):
                 content=resp.content,
                 reason=resp.reason,
             )
-            with open(
-                join(MOCK_DIR, cache._hash_name(url + json.dumps(params or dict()))),
-                "wb",
-            ) as resp_cache:
+            with open(_mock_path(url, params), "wb") as resp_cache:
                 pickle.dump(resp_dict, resp_cache)
             return MockResponse(**resp_dict)
 
@@ -131,10 +144,7 @@ def test_github_mocked_storage(tmpdir):
     def request_load(_, url, *__, params=None, **___):
         """Loads request result"""
         try:
-            with open(
-                join(MOCK_DIR, cache._hash_name(url + json.dumps(params or dict()))),
-                "rb",
-            ) as resp_cache:
+            with open(_mock_path(url, params), "rb") as resp_cache:
                 return MockResponse(**pickle.load(resp_cache))
         except FileNotFoundError:
             pytest.fail("Please, update mock responses (see UPDATE_MOCK)")
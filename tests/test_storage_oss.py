@@ -64,6 +64,7 @@ def test_mocked_storage():
         raise OssError(500, headers={}, body=None, details={"Message": ""})
 
     storage_mock = ObjectStorageMock(raise_404, raise_416, raise_500)
+    list_mock = dict(max_keys=100, markers=[])
 
     class Auth:
         """oss2.Auth/oss2.StsAuth/oss2.AnonymousAuth"""
@@ -156,16 +157,25 @@ def test_mocked_storage():
             """oss2.Bucket.delete_bucket"""
             storage_mock.delete_locator(self._bucket_name)
 
-        def list_objects(self, prefix=None, max_keys=None, **_):
+        def list_objects(self, prefix=None, max_keys=None, marker="", **_):
             """oss2.Bucket.list_objects"""
+            max_keys = min(max_keys or list_mock["max_keys"], list_mock["max_keys"])
+            list_mock["markers"].append(marker)
             response = storage_mock.get_locator(
-                self._bucket_name,
-                prefix=prefix,
-                limit=max_keys,
-                raise_404_if_empty=False,
+                self._bucket_name, prefix=prefix, raise_404_if_empty=False
             )
             object_list = []
-            for key, headers in response.items():
+            for key, headers in sorted(response.items()):
+                if key <= marker:
+                    continue
+
+                elif len(object_list) == max_keys:
+                    return ListResult(
+                        object_list=object_list,
+                        is_truncated=True,
+                        next_marker=object_list[-1].key,
+                    )
+
                 obj = HeadObjectResult(Response(headers=headers))
                 obj.key = key
                 object_list.append(obj)
@@ -256,6 +266,31 @@ def test_mocked_storage():
                 unsecure=True, **system_parameters
             )._endpoint == endpoint.replace("https", "http")
 
+            # Test: Listing on several pages
+            list_path = tester.base_dir_path + "listing/"
+            list_names = [f"file{index}.dat" for index in range(3)]
+            list_paths = [list_path + name for name in list_names]
+            for path in list_paths:
+                storage_mock.put_object(tester.locator, path.split("/", 1)[1], b"0")
+
+            client_kwargs = system._cached_client_kwargs(list_path)
+            client_kwargs_copy = client_kwargs.copy()
+            list_mock["max_keys"] = 2
+            try:
+                list_mock["markers"].clear()
+                assert [
+                    name for name, _ in system.list_objects(list_path)
+                ] == list_names, "List objects, all pages"
+                assert list_mock["markers"] == [
+                    "",
+                    list_paths[1].split("/", 1)[1],
+                ], "List objects, next page marker"
+                assert client_kwargs == client_kwargs_copy, "Client arguments unchanged"
+            finally:
+                list_mock["max_keys"] = 100
+            for path in list_paths:
+                system.remove(path)
+
             # Test: Symlink limitations
             symlink_path = tester.locator + "/symlink"
             with pytest.raises(ObjectNotImplementedError):
@@ -36,14 +36,31 @@ def test_handle_client_error():
             raise ClientError(response, "testing")
 
 
+def test_request_body():
+    """Test airfs.s3._request_body"""
+    from airfs.storage.s3 import _request_body
+
+    buffer = bytearray(b"0123456789")
+    assert _request_body(memoryview(buffer)) is buffer, "No copy"
+    assert _request_body(memoryview(buffer)[:5]) == b"01234", "Partial buffer"
+
+
 def test_mocked_storage():
     """Tests airfs.s3 with a mock"""
     from datetime import datetime
     from io import BytesIO, UnsupportedOperation
 
-    from airfs.storage.s3 import S3RawIO, _S3System, S3BufferedIO
+    import airfs.storage.s3 as s3
+    from airfs._core.exceptions import ObjectNotFoundError, ObjectPermissionError
+    from airfs.storage.s3 import (
+        S3RawIO,
+        _S3System,
+        S3BufferedIO,
+    )
+    from airfs._core.io_base import MAX_WORKERS
 
-    from botocore.exceptions import ClientError  # type: ignore
+    from botocore.config import Config  # type: ignore
+    from botocore.exceptions import ClientError, IncompleteReadError  # type: ignore
     import boto3  # type: ignore
 
     from tests.test_storage import StorageTester
@@ -70,6 +87,9 @@ def test_mocked_storage():
     )
 
     no_head = False
+    copy_mock = dict(max_size=None, failing_part=None, aborted=[])
+    delete_denied = set()
+    list_mock = dict(max_keys=1000, pages=[])
 
     class Client:
         """boto3.client"""
@@ -81,11 +101,16 @@ def test_mocked_storage():
         @staticmethod
         def get_object(Bucket=None, Key=None, Range=None, **_):
             """boto3.client.get_object"""
-            return dict(
-                Body=BytesIO(
-                    storage_mock.get_object(Bucket, Key, header=dict(Range=Range))
-                )
-            )
+            content = storage_mock.get_object(Bucket, Key, header=dict(Range=Range))
+            response = storage_mock.head_object(Bucket, Key)
+            response["Body"] = BytesIO(content)
+            if Range:
+                start = int(Range.split("=")[1].split("-")[0])
+                end = start + len(content) - 1
+                size = response["ContentLength"]
+                response["ContentRange"] = f"bytes {start}-{end}/{size}"
+                response["ContentLength"] = len(content)
+            return response
 
         @staticmethod
         def head_object(Bucket=None, Key=None, **_):
@@ -104,6 +129,22 @@ def test_mocked_storage():
             """boto3.client.delete_object"""
             storage_mock.delete_object(Bucket, Key)
 
+        @staticmethod
+        def delete_objects(Bucket=None, Delete=None, **_):
+            """boto3.client.delete_objects"""
+            errors = []
+            for obj in Delete["Objects"]:
+                key = obj["Key"]
+                if key in delete_denied:
+                    errors.append(dict(Key=key, Code="AccessDenied", Message="Error"))
+                    continue
+                try:
+                    storage_mock.delete_object(Bucket, key)
+                except ClientError:
+                    # Missing keys are reported as deleted
+                    continue
+            return dict(Errors=errors) if errors else dict()
+
         @staticmethod
         def head_bucket(Bucket=None, **_):
             """boto3.client.head_bucket"""
@@ -117,6 +158,21 @@ def test_mocked_storage():
         @staticmethod
         def copy_object(Bucket=None, Key=None, CopySource=None, **_):
             """boto3.client.copy_object"""
+            max_size = copy_mock["max_size"]
+            if max_size is not None and (
+                storage_mock.get_object_size(CopySource["Bucket"], CopySource["Key"])
+                > max_size
+            ):
+                raise ClientError(
+                    {
+                        "Error": {
+                            "Code": "InvalidRequest",
+                            "Message": "The specified copy source is larger than the "
+                            f"maximum allowable size for a copy source: {max_size}",
+                        }
+                    },
+                    "CopyObject",
+                )
             storage_mock.copy_object(
                 CopySource["Key"],
                 Key,
@@ -130,13 +186,26 @@ def test_mocked_storage():
             storage_mock.delete_locator(Bucket)
 
         @staticmethod
-        def list_objects_v2(Bucket=None, Prefix=None, MaxKeys=None, **_):
+        def list_objects_v2(
+            Bucket=None, Prefix=None, MaxKeys=None, ContinuationToken=None, **_
+        ):
             """boto3.client.list_objects_v2"""
+            max_keys = min(MaxKeys or list_mock["max_keys"], list_mock["max_keys"])
+            list_mock["pages"].append(ContinuationToken)
             objects = []
 
-            for name, header in storage_mock.get_locator(
-                Bucket, prefix=Prefix, limit=MaxKeys, raise_404_if_empty=False
-            ).items():
+            for name, header in sorted(
+                storage_mock.get_locator(
+                    Bucket, prefix=Prefix, raise_404_if_empty=False
+                ).items()
+            ):
+                if ContinuationToken and name <= ContinuationToken:
+                    continue
+
+                elif len(objects) == max_keys:
+                    return dict(
+                        Contents=objects, NextContinuationToken=objects[-1]["Key"]
+                    )
 
                 header["Key"] = name
                 objects.append(header)
@@ -145,6 +214,31 @@ def test_mocked_storage():
                 return dict()
             return dict(Contents=objects)
 
+        @staticmethod
+        def get_paginator(operation_name):
+            """boto3.client.get_paginator"""
+            operation = getattr(Client, operation_name)
+
+            class Paginator:
+                """botocore.paginate.Paginator"""
+
+                @staticmethod
+                def paginate(PaginationConfig=None, **kwargs):
+                    """botocore.paginate.Paginator.paginate"""
+                    if PaginationConfig:
+                        kwargs["MaxKeys"] = PaginationConfig["PageSize"]
+                    while True:
+                        response = operation(**kwargs)
+                        yield response
+                        try:
+                            kwargs["ContinuationToken"] = response[
+                                "NextContinuationToken"
+                            ]
+                        except KeyError:
+                            return
+
+            return Paginator
+
         @staticmethod
         def list_buckets(**__):
             """boto3.client.list_buckets"""
@@ -181,8 +275,37 @@ def test_mocked_storage():
         ):
             """boto3.client.upload_part"""
             assert UploadId == 123
+            if PartNumber == copy_mock["failing_part"]:
+                raise RuntimeError("Part upload failure")
             return storage_mock.put_object(Bucket, Key + str(PartNumber), Body)
 
+        @staticmethod
+        def upload_part_copy(
+            Bucket=None,
+            Key=None,
+            PartNumber=None,
+            CopySource=None,
+            CopySourceRange=None,
+            UploadId=None,
+            **_,
+        ):
+            """boto3.client.upload_part_copy"""
+            assert UploadId == 123
+            if PartNumber == copy_mock["failing_part"]:
+                raise RuntimeError("Part copy failure")
+            content = storage_mock.get_object(
+                CopySource["Bucket"],
+                CopySource["Key"],
+                header=dict(Range=CopySourceRange),
+            )
+            header = storage_mock.put_object(Bucket, Key + str(PartNumber), content)
+            return dict(CopyPartResult=dict(ETag=header["ETag"]))
+
+        @staticmethod
+        def abort_multipart_upload(UploadId=None, **_):
+            """boto3.client.abort_multipart_upload"""
+            copy_mock["aborted"].append(UploadId)
+
         @staticmethod
         def generate_presigned_url(ClientMethod, Params=None, **_):
             """boto3.client.generate_presigned_url"""
@@ -202,12 +325,40 @@ def test_mocked_storage():
     boto3_session_session = boto3.session.Session
     boto3.client = Client
     boto3.session.Session = Session
+    s3_default_session = s3._DEFAULT_SESSION
+    s3._DEFAULT_SESSION = None
 
     # Tests
     try:
         # Init mocked system
         system = _S3System()
         storage_mock.attach_io_system(system)
+        assert system.client is system.client, "Client created once"
+
+        # Test: Default session reused by systems without session parameters
+        other_system = _S3System()
+        session = system._get_session()
+        assert isinstance(session, Session), "Default session"
+        assert session is s3._DEFAULT_SESSION, "Default session"
+        assert other_system._get_session() is session, "Session shared"
+        assert other_system.client is not system.client, "Client per system"
+        assert (
+            _S3System(
+                storage_parameters=dict(session=dict(region_name="eu-west-3"))
+            )._get_session()
+            is not session
+        ), "Specific session"
+
+        # Test: Default configuration passed to the client
+        for client in (system.client, other_system.client):
+            config = client.kwargs["config"]
+            assert config.max_pool_connections == MAX_WORKERS, "Pool size"
+            assert config.tcp_keepalive, "Keepalive"
+            assert config.retries == dict(mode="standard", max_attempts=5), "Retries"
+
+        def remove_many(paths):
+            """Remove several objects with a batch request"""
+            system._remove_many([system.get_client_kwargs(path) for path in paths])
 
         # Tests
         with StorageTester(
@@ -221,11 +372,180 @@ def test_mocked_storage():
             # Common tests
             tester.test_common()
 
+            # Test: stat fields
+            stat_fields = system.stat(tester.base_dir_path + "file0.dat")._fields
+            for key in ("contentlength", "lastmodified", "creationdate"):
+                assert key not in stat_fields, "Stat, converted keys excluded"
+            assert "etag" in stat_fields, "Stat, other keys kept"
+
             # Test: Unsecure mode
             file_path = tester.base_dir_path + "file0.dat"
             with S3RawIO(file_path, unsecure=True) as file:
                 assert file._client.kwargs["use_ssl"] is False
 
+            # Test: Object start read with header in read mode
+            file_path = tester.base_dir_path + "file_head_content.dat"
+            with S3RawIO(file_path, "wb") as file:
+                file.write(b"0123456789")
+
+            with S3RawIO(file_path) as file:
+                content = file.readall()
+                assert file._head_content == content, "Read on open"
+                assert file._head()["ContentLength"] == len(content)
+
+            with S3RawIO(file_path, head_read_size=0) as file:
+                assert file._head_content is None, "Object start read disabled"
+                assert file._size == len(content)
+                assert file.readall() == content
+
+            with S3RawIO(file_path) as file:
+                file._reset_head()
+                assert file._head_content is None, "Object start reset with head"
+
+            head_read_size = S3RawIO.HEAD_READ_SIZE
+            S3RawIO.HEAD_READ_SIZE = 2
+            try:
+                with S3RawIO(file_path) as file:
+                    assert file._head_content == content[:2]
+                    assert file._size == len(content)
+                    assert file.read(2) == content[:2], "Read from head content"
+                    buffer = bytearray(len(content))
+                    assert file.readinto(buffer) == len(content) - 2
+                    assert buffer[: len(content) - 2] == content[2:]
+                    assert file.read(10) == b"", "Read after end"
+
+                # Test: Truncated response is not read as the end of the object
+                with S3RawIO(file_path) as file:
+                    get_object = file._client.get_object
+
+                    def get_truncated_object(**kwargs):
+                        """Returns a response with a truncated body"""
+                        response = get_object(**kwargs)
+                        response["Body"] = BytesIO(response["Body"].read()[:-1])
+                        return response
+
+                    file._client.get_object = get_truncated_object
+                    try:
+                        file.seek(2)
+                        with pytest.raises(IncompleteReadError):
+                            file.readinto(bytearray(len(content)))
+                    finally:
+                        del file._client.get_object
+            finally:
+                S3RawIO.HEAD_READ_SIZE = head_read_size
+
+            # Test: Multipart copy of big objects
+            copy_path = tester.base_dir_path + "file_head_content_copy.dat"
+            part_size = _S3System.MULTIPART_COPY_PART_SIZE
+            copy_mock["max_size"] = 5
+            _S3System.MULTIPART_COPY_PART_SIZE = 4
+            try:
+                system.copy(file_path, copy_path)
+                with S3RawIO(copy_path) as file:
+                    assert file.readall() == content
+
+                # Test: Multipart copy aborted on any failure
+                copy_mock["failing_part"] = 2
+                with pytest.raises(RuntimeError):
+                    system.copy(file_path, copy_path)
+                assert copy_mock["aborted"] == [123], "Multipart copy aborted"
+            finally:
+                copy_mock.update(max_size=None, failing_part=None)
+                _S3System.MULTIPART_COPY_PART_SIZE = part_size
+
+            # Test: Multipart upload with limited awaiting buffers
+            part_size = S3BufferedIO.MINIMUM_BUFFER_SIZE
+            parts_content = b"a" * part_size + b"b" * part_size + b"c"
+            parts_path = tester.base_dir_path + "file_parts.dat"
+            with S3BufferedIO(
+                parts_path, "wb", buffer_size=part_size, max_buffers=1
+            ) as file:
+                file.write(parts_content)
+            with S3RawIO(parts_path) as file:
+                assert file.readall() == parts_content, "Parts order"
+            system.remove(parts_path)
+
+            # Test: Multipart upload aborted on any failure
+            copy_mock["aborted"].clear()
+            copy_mock["failing_part"] = 2
+            try:
+                with pytest.raises(RuntimeError):
+                    with S3BufferedIO(parts_path, "wb", buffer_size=part_size) as file:
+                        file.write(parts_content)
+                assert copy_mock["aborted"] == [123], "Multipart upload aborted"
+            finally:
+                copy_mock["failing_part"] = None
+
+            # Test: Listing on several pages
+            list_path = tester.base_dir_path + "listing/"
+            list_names = [f"file{index}.dat" for index in range(5)]
+            list_paths = [list_path + name for name in list_names]
+            for path in list_paths:
+                storage_mock.put_object(tester.locator, path.split("/", 1)[1], b"0")
+
+            list_mock["max_keys"] = 2
+            try:
+                list_mock["pages"].clear()
+                assert [
+                    name for name, _ in system.list_objects(list_path)
+                ] == list_names, "List objects, all pages"
+                assert len(list_mock["pages"]) == 3, "List objects, pages count"
+
+                list_mock["pages"].clear()
+                assert [
+                    name for name, _ in system.list_objects(list_path, max_results=3)
+                ] == list_names[:3], "List objects with max results, all pages"
+                assert len(list_mock["pages"]) == 2, "List objects, pages count"
+            finally:
+                list_mock["max_keys"] = 1000
+            remove_many(list_paths)
+
+            # Test: Remove many objects
+            remove_many((file_path, copy_path))
+            assert not system.exists(file_path)
+            assert not system.exists(copy_path)
+
+            # Test: Remove many objects, missing objects are reported as deleted
+            with pytest.raises(ObjectNotFoundError):
+                system.remove(file_path)
+            remove_many((file_path,))
+
+            # Test: Remove many objects, errors raised after all batches
+            denied_path = tester.base_dir_path + "file_denied.dat"
+            with S3RawIO(denied_path, "wb") as file:
+                file.write(b"0")
+            with S3RawIO(file_path, "wb") as file:
+                file.write(b"0")
+            delete_denied.add(denied_path.split("/", 1)[1])
+            max_delete_objects = s3._MAX_DELETE_OBJECTS
+            s3._MAX_DELETE_OBJECTS = 1
+            try:
+                with pytest.raises(ObjectPermissionError):
+                    remove_many((denied_path, file_path))
+                assert not system.exists(file_path), "Next batch removed"
+                assert system.exists(denied_path), "Denied object kept"
+            finally:
+                s3._MAX_DELETE_OBJECTS = max_delete_objects
+                delete_denied.clear()
+            remove_many((denied_path,))
+
+            # Test: Connection pool sized for the system workers count
+            system._workers_count = 4
+            system._client = None
+            config = system.client.kwargs["config"]
+            assert config.max_pool_connections == 4, "Pool size"
+            system._workers_count = MAX_WORKERS
+
+            # Test: User configuration
+            system._storage_parameters["client"] = dict(
+                config=Config(max_pool_connections=1)
+            )
+            system._client = None
+            config = system.client.kwargs["config"]
+            assert config.max_pool_connections == 1, "User config has priority"
+            assert config.tcp_keepalive, "Merged with default config"
+            assert config.retries["max_attempts"] == 5, "Merged with default config"
+
             # Test: Header values may be missing
             no_head = True
             with pytest.raises(UnsupportedOperation):
@@ -240,3 +560,4 @@ def test_mocked_storage():
     finally:
         boto3.client = boto3_client
         boto3.session.Session = boto3_session_session
+        s3._DEFAULT_SESSION = s3_default_session
@@ -110,6 +110,7 @@ class MockSystem(_SystemBase):
                 Other storage system. May be required for some storage.
         """
         self.client.copy_object(src_path=self.relpath(src), dst_path=self.relpath(dst))
+        self._head_cache.clear()
 
     def _remove(self, client_kwargs):
         """